@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+
+source "$(dirname "$(realpath "$0")")"/source_me.sh
+
+python -c "
+import sys
+from setuptools import find_packages
+from setup import PACKAGES
+
+found = set(find_packages(include=['sklearn_porter', 'sklearn_porter.*']))
+missing = sorted(found - set(PACKAGES))
+obsolete = sorted(set(PACKAGES) - found)
+for name in missing:
+    print('Missing package in setup.py: ' + name)
+for name in obsolete:
+    print('Obsolete package in setup.py: ' + name)
+sys.exit(1 if missing or obsolete else 0)
+"
+
+exit $?
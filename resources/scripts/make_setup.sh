@@ -23,5 +23,6 @@ if ! conda env list | grep "${CONDA_ENV_NAME}" ; then
   conda run -n "${CONDA_ENV_NAME}" --no-capture-output \
     python -m pip install --no-cache-dir --upgrade pip
   conda run -n "${CONDA_ENV_NAME}" --no-capture-output \
-    python -m pip install --no-cache-dir -e ".[development,examples]"
+    python -m pip install --no-cache-dir \
+      -r requirements-dev.txt -e ".[examples]"
 fi
@@ -1,17 +1,47 @@
-from os.path import abspath, dirname, exists, join
-from setuptools import find_packages, setup
-from sys import version_info
+import os
+from functools import lru_cache
+from os.path import abspath, dirname, join
 
+_HERE = abspath(dirname(__file__))
+_README = join(_HERE, 'readme.md')
+_VERSION_FILE = join(_HERE, 'sklearn_porter', '__version__.txt')
 
-def _check_python_version():
-    """Check the used Python version."""
-    if version_info[:2] < (3, 6):
-        from logging import warning
-        msg = 'The used Python version is not supported' \
-              ' and tested, please upgrade Python >= 3.6'
-        warning(msg)
+# Check changes with `make packages`:
+PACKAGES = (
+    'sklearn_porter',
+    'sklearn_porter.cli',
+    'sklearn_porter.cli.command',
+    'sklearn_porter.cli.common',
+    'sklearn_porter.cli.utils',
+    'sklearn_porter.decorators',
+    'sklearn_porter.enums',
+    'sklearn_porter.estimator',
+    'sklearn_porter.estimator.AdaBoostClassifier',
+    'sklearn_porter.estimator.BernoulliNB',
+    'sklearn_porter.estimator.DecisionTreeClassifier',
+    'sklearn_porter.estimator.ExtraTreesClassifier',
+    'sklearn_porter.estimator.GaussianNB',
+    'sklearn_porter.estimator.KNeighborsClassifier',
+    'sklearn_porter.estimator.LinearSVC',
+    'sklearn_porter.estimator.MLPClassifier',
+    'sklearn_porter.estimator.MLPRegressor',
+    'sklearn_porter.estimator.NuSVC',
+    'sklearn_porter.estimator.RandomForestClassifier',
+    'sklearn_porter.estimator.SVC',
+    'sklearn_porter.exceptions',
+    'sklearn_porter.language',
+    'sklearn_porter.language.c',
+    'sklearn_porter.language.go',
+    'sklearn_porter.language.java',
+    'sklearn_porter.language.js',
+    'sklearn_porter.language.php',
+    'sklearn_porter.language.ruby',
+    'sklearn_porter.meta',
+    'sklearn_porter.utils',
+)
 
 
+@lru_cache(maxsize=None)
 def _read_text(path):
     """
     Read the content from a text file.
@@ -25,28 +55,32 @@ def _read_text(path):
     -------
     Return the content as string.
     """
-    content = ''
-    if exists(path):
-        content = open(path, 'r', encoding='utf-8').read().strip()
-    return content
+    flags = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)  # Linux only
+    try:
+        fd = os.open(path, flags)
+    except FileNotFoundError:
+        return ''
+    except PermissionError:  # O_NOATIME requires the ownership of the file
+        fd = os.open(path, os.O_RDONLY)
+    try:
+        content = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return content.decode('utf-8').strip()
 
 
 def main():
-    _check_python_version()
+    from setuptools import setup
 
     name = 'sklearn-porter'
     desc = 'Transpile trained scikit-learn models ' \
            'to C, Java, JavaScript and others.'
 
-    file_dir = abspath(dirname(__file__))
-
     # Read readme.md
-    path_readme = join(file_dir, 'readme.md')
-    long_desc = _read_text(path_readme)
+    long_desc = _read_text(_README)
 
     # Read __version__.txt
-    path_version = join(file_dir, 'sklearn_porter', '__version__.txt')
-    version = _read_text(path_version)
+    version = _read_text(_VERSION_FILE)
 
     setup(
         name=name,
@@ -58,30 +92,21 @@ def main():
             'sklearn',
         ],
         url='https://github.com/nok/sklearn-porter',
-        install_requires=[
+        python_requires='>=3.6',
+        install_requires=(
             'scikit-learn>=0.17,<=0.22a0',
             'jinja2>=2.11',
             'joblib>=1',
             'loguru>=0.5',
             'tabulate>=0.8',
-        ],
+        ),
         extras_require={
-            'development': [
-                'codecov>=2.1',
-                'jupytext>=1.10',
-                'pylint>=2.7',
-                'pytest-cov>=2.11',
-                'pytest-xdist>=2.2',
-                'pytest>=6.2',
-                'twine>=3.3',
-                'yapf>=0.30',
-            ],
-            'examples': [
+            'examples': (
                 'notebook==5.*',
-                'Pygments>=2.8'
-            ],
+                'Pygments>=2.8',
+            ),
         },
-        packages=find_packages(exclude=['tests.*', 'tests']),
+        packages=PACKAGES,
         test_suite='pytest',
         include_package_data=True,
         entry_points={
@@ -1,15 +1,19 @@
+import shlex
 import urllib.request
-from abc import ABCMeta
 from collections import OrderedDict
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib import import_module
+from io import BytesIO
 from json import JSONDecodeError, loads
-from multiprocessing import Pool, cpu_count
-from os import environ, remove
+from multiprocessing import cpu_count
+from os import chmod, environ, remove, replace
+from os.path import getsize
 from pathlib import Path
-from shutil import which
+from shutil import copyfileobj, which
 from subprocess import STDOUT, CalledProcessError, check_output
 from sys import platform, stdout, version_info
-from tempfile import mktemp
+from tempfile import mkstemp, mktemp
 from textwrap import dedent
 from time import sleep
 from typing import Callable, Dict, List, Optional, Tuple, Union
@@ -17,7 +21,6 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 # Additional installed modules:
 import numpy as np
 from loguru import logger as L
-from tabulate import tabulate
 
 # scikit-learn
 from sklearn import __version__ as sklearn_version
@@ -25,12 +28,82 @@ from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
 from sklearn.ensemble import BaseEnsemble
 from sklearn.metrics import accuracy_score
 
+# Optimizers and pipelines are optional, depending on the installed version:
+try:
+    # pylint: disable=protected-access
+    from sklearn.model_selection._search import BaseSearchCV
+except ImportError:
+    BaseSearchCV = None
+try:
+    from sklearn.model_selection import GridSearchCV
+except ImportError:
+    GridSearchCV = None
+try:
+    from sklearn.model_selection import RandomizedSearchCV
+except ImportError:
+    RandomizedSearchCV = None
+try:
+    from sklearn.pipeline import Pipeline
+except ImportError:
+    Pipeline = None
+
 # sklearn-porter
 from sklearn_porter import decorators as decorator
 from sklearn_porter import enums as enum
 from sklearn_porter import exceptions as exception
 from sklearn_porter import meta
-from sklearn_porter.utils import options
+from sklearn_porter.utils import default_converter, options
+
+# Supported estimators and their modules in scikit-learn and sklearn-porter:
+_DISPATCH = {
+    # Classifiers:
+    'AdaBoostClassifier': (
+        'sklearn.ensemble', 'sklearn_porter.estimator.AdaBoostClassifier'
+    ),
+    'BernoulliNB': (
+        'sklearn.naive_bayes', 'sklearn_porter.estimator.BernoulliNB'
+    ),
+    'DecisionTreeClassifier': (
+        'sklearn.tree', 'sklearn_porter.estimator.DecisionTreeClassifier'
+    ),
+    'ExtraTreesClassifier': (
+        'sklearn.ensemble', 'sklearn_porter.estimator.ExtraTreesClassifier'
+    ),
+    'GaussianNB': (
+        'sklearn.naive_bayes', 'sklearn_porter.estimator.GaussianNB'
+    ),
+    'KNeighborsClassifier': (
+        'sklearn.neighbors', 'sklearn_porter.estimator.KNeighborsClassifier'
+    ),
+    'LinearSVC': ('sklearn.svm', 'sklearn_porter.estimator.LinearSVC'),
+    'MLPClassifier': (
+        'sklearn.neural_network', 'sklearn_porter.estimator.MLPClassifier'
+    ),
+    'NuSVC': ('sklearn.svm', 'sklearn_porter.estimator.NuSVC'),
+    'RandomForestClassifier': (
+        'sklearn.ensemble', 'sklearn_porter.estimator.RandomForestClassifier'
+    ),
+    'SVC': ('sklearn.svm', 'sklearn_porter.estimator.SVC'),
+    # Regressors:
+    'MLPRegressor': (
+        'sklearn.neural_network', 'sklearn_porter.estimator.MLPRegressor'
+    ),
+}
+
+_CLASSIFIERS = (
+    'AdaBoostClassifier',
+    'BernoulliNB',
+    'DecisionTreeClassifier',
+    'ExtraTreesClassifier',
+    'GaussianNB',
+    'KNeighborsClassifier',
+    'LinearSVC',
+    'NuSVC',
+    'RandomForestClassifier',
+    'SVC',
+    'MLPClassifier',  # scikit-learn version >= 0.18.0
+)
+_REGRESSORS = ('MLPRegressor', )
 
 
 @decorator.aliased
@@ -62,17 +135,15 @@ class Estimator:
             Change the default converter of all floating numbers from the model
             data. By default a simple string cast `str(value)` will be used.
         """
-        L.remove()  # remove basic logger
-        logging_level = options.get('logging.level')
-        L.add(stdout, level=logging_level)
+        _configure_logging(options.get('logging.level'))
 
         self.python_version = '.'.join(map(str, version_info[:3]))
         self.porter_version = str(meta.__version__)
 
-        L.debug('Platform: {}'.format(platform))
-        L.debug('Python: v{}'.format(self.python_version))
-        L.debug('Package: scikit-learn: v{}'.format(sklearn_version))
-        L.debug('Package: sklearn-porter: v{}'.format(self.porter_version))
+        L.debug('Platform: {}', platform)
+        L.debug('Python: v{}', self.python_version)
+        L.debug('Package: scikit-learn: v{}', sklearn_version)
+        L.debug('Package: sklearn-porter: v{}', self.porter_version)
 
         self.estimator = estimator  # see @estimator.setter
 
@@ -83,7 +154,7 @@ class Estimator:
         self.language = either_or(language, self._estimator.DEFAULT_LANGUAGE)
         self.template = either_or(template, self._estimator.DEFAULT_TEMPLATE)
         self.class_name = either_or(class_name, self._estimator.estimator_name)
-        self.converter = either_or(converter, lambda x: str(x))
+        self.converter = either_or(converter, default_converter)
 
     @property
     def estimator(self):
@@ -191,10 +262,7 @@ class Estimator:
         est = estimator  # shorter <3
         qualname = _get_qualname(est)
 
-        L.debug(
-            'Start validation of the passed '
-            'estimator: `{}`.'.format(qualname)
-        )
+        L.debug('Start validation of the passed estimator: `{}`.', qualname)
 
         # Check BaseEstimator:
         if not isinstance(est, BaseEstimator):
@@ -219,96 +287,63 @@ class Estimator:
 
         # Check GridSearchCV and RandomizedSearchCV:
         L.debug('Check whether the estimator is embedded in an optimizer.')
-        try:
-            from sklearn.model_selection._search import (
-                BaseSearchCV,
-            )  # pylint: disable=protected-access
-        except ImportError:
-            msg = (
-                'Your installed version of scikit-learn v{} '
-                'does not support optimizers in general.'
-                ''.format(sklearn_version)
-            )
-            L.warning(msg)
-        else:
-            if isinstance(est, BaseSearchCV):
-                L.debug('└> Yes, the estimator is embedded in an optimizer.')
-                try:
-                    from sklearn.model_selection import GridSearchCV
-                    from sklearn.model_selection import RandomizedSearchCV
-                except ImportError:
-                    msg = (
-                        'Your installed version of scikit-learn '
-                        'v{} does not support `GridSearchCV` or '
-                        '`RandomizedSearchCV`.'.format(sklearn_version)
-                    )
-                    L.warning(msg)
-                else:
-                    optimizers = (GridSearchCV, RandomizedSearchCV)
-                    if isinstance(est, optimizers):
-                        # pylint: disable=protected-access
-                        is_fitted = (
-                            hasattr(est, 'best_estimator_')
-                            and est.best_estimator_
-                        )
-                        if is_fitted:
-                            est = est.best_estimator_
-                            est_qualname = _get_qualname(est)
-                            msg = (
-                                'Extract the embedded estimator of '
-                                'type `{}` from optimizer `{}`.'
-                                ''.format(est_qualname, qualname)
-                            )
-                            L.info(msg)
-                        # pylint: enable=protected-access
-                        else:
-                            msg = 'The embedded estimator is not fitted.'
-                            L.error(msg)
-                            raise ValueError(msg)
-                    else:
-                        msg = (
-                            'The used optimizer `{}` is not supported '
-                            'by this version of sklearn-porter. Try to '
-                            'extract the internal estimator manually '
-                            'and pass it.'.format(qualname)
-                        )
-                        L.error(msg)
-                        raise ValueError(msg)
-            else:
-                L.debug('└> No, the estimator is not embedded in an optimizer.')
-
-        # Check Pipeline:
-        L.debug('Check whether the estimator is embedded in a pipeline.')
-        try:
-            from sklearn.pipeline import Pipeline
-        except ImportError:
-            msg = (
-                'Your installed version of scikit-learn '
-                'v{} does not support pipelines.'.format(sklearn_version)
-            )
-            L.warning(msg)
-        else:
-            if isinstance(est, Pipeline):
-                L.debug('└> Yes, the estimator is embedded in a pipeline.')
+        if BaseSearchCV and isinstance(est, BaseSearchCV):
+            L.debug('└> Yes, the estimator is embedded in an optimizer.')
+            optimizers = tuple(filter(None, (GridSearchCV, RandomizedSearchCV)))
+            if isinstance(est, optimizers):
                 # pylint: disable=protected-access
-                has_est = (
-                    hasattr(est, '_final_estimator') and est._final_estimator
+                is_fitted = (
+                    hasattr(est, 'best_estimator_') and est.best_estimator_
                 )
-                if has_est:
-                    est = est._final_estimator
+                if is_fitted:
+                    est = est.best_estimator_
                     est_qualname = _get_qualname(est)
                     msg = (
-                        'Extract the embedded estimator of type '
-                        '`{}` from the pipeline.'.format(est_qualname)
+                        'Extract the embedded estimator of '
+                        'type `{}` from optimizer `{}`.'
+                        ''.format(est_qualname, qualname)
                     )
                     L.info(msg)
                 # pylint: enable=protected-access
                 else:
-                    msg = 'There is no final estimator is the pipeline.'
+                    msg = 'The embedded estimator is not fitted.'
                     L.error(msg)
                     raise ValueError(msg)
             else:
-                L.debug('└> No, the estimator is not embedded in a pipeline.')
+                msg = (
+                    'The used optimizer `{}` is not supported '
+                    'by this version of sklearn-porter. Try to '
+                    'extract the internal estimator manually '
+                    'and pass it.'.format(qualname)
+                )
+                L.error(msg)
+                raise ValueError(msg)
+        else:
+            L.debug('└> No, the estimator is not embedded in an optimizer.')
+
+        # Check Pipeline:
+        L.debug('Check whether the estimator is embedded in a pipeline.')
+        if Pipeline and isinstance(est, Pipeline):
+            L.debug('└> Yes, the estimator is embedded in a pipeline.')
+            # pylint: disable=protected-access
+            has_est = (
+                hasattr(est, '_final_estimator') and est._final_estimator
+            )
+            if has_est:
+                est = est._final_estimator
+                est_qualname = _get_qualname(est)
+                msg = (
+                    'Extract the embedded estimator of type '
+                    '`{}` from the pipeline.'.format(est_qualname)
+                )
+                L.info(msg)
+            # pylint: enable=protected-access
+            else:
+                msg = 'There is no final estimator is the pipeline.'
+                L.error(msg)
+                raise ValueError(msg)
+        else:
+            L.debug('└> No, the estimator is not embedded in a pipeline.')
 
         # Check ClassifierMixin:
         L.debug(
@@ -358,142 +393,29 @@ class Estimator:
         represents and includes the original base estimator.
         """
         est = estimator  # shorter <3
-        qualname = _get_qualname(est)
-        L.debug('Start loading the passed estimator: `{}`.'.format(qualname))
-
-        name = est.__class__.__qualname__
-
-        msg = (
-            'Your installed version of scikit-learn v{} does not support '
-            'the `{}` estimator. Please update your local installation '
-            'of scikit-learn with `pip install -U scikit-learn`.'
+        L.opt(lazy=True).debug(
+            'Start loading the passed estimator: `{}`.',
+            lambda: _get_qualname(est)
         )
 
-        # Classifiers:
-        if name == 'DecisionTreeClassifier':
-            from sklearn.tree.tree import (
-                DecisionTreeClassifier as DecisionTreeClassifierClass,
-            )
-
-            if isinstance(est, DecisionTreeClassifierClass):
-                from sklearn_porter.estimator.DecisionTreeClassifier import (
-                    DecisionTreeClassifier,
-                )
-
-                return DecisionTreeClassifier(est)
-        elif name == 'AdaBoostClassifier':
-            from sklearn.ensemble.weight_boosting import (
-                AdaBoostClassifier as AdaBoostClassifierClass,
-            )
-
-            if isinstance(estimator, AdaBoostClassifierClass):
-                from sklearn_porter.estimator.AdaBoostClassifier import (
-                    AdaBoostClassifier,
-                )
-
-                return AdaBoostClassifier(est)
-        elif name == 'RandomForestClassifier':
-            from sklearn.ensemble.forest import (
-                RandomForestClassifier as RandomForestClassifierClass,
-            )
-
-            if isinstance(estimator, RandomForestClassifierClass):
-                from sklearn_porter.estimator.RandomForestClassifier import (
-                    RandomForestClassifier,
-                )
-
-                return RandomForestClassifier(est)
-        elif name == 'ExtraTreesClassifier':
-            from sklearn.ensemble.forest import (
-                ExtraTreesClassifier as ExtraTreesClassifierClass,
-            )
-
-            if isinstance(estimator, ExtraTreesClassifierClass):
-                from sklearn_porter.estimator.ExtraTreesClassifier import (
-                    ExtraTreesClassifier,
-                )
-
-                return ExtraTreesClassifier(est)
-        elif name == 'LinearSVC':
-            from sklearn.svm.classes import LinearSVC as LinearSVCClass
-
-            if isinstance(estimator, LinearSVCClass):
-                from sklearn_porter.estimator.LinearSVC import LinearSVC
-
-                return LinearSVC(est)
-        elif name == 'SVC':
-            from sklearn.svm.classes import SVC as SVCClass
-
-            if isinstance(estimator, SVCClass):
-                from sklearn_porter.estimator.SVC import SVC
-
-                return SVC(est)
-        elif name == 'NuSVC':
-            from sklearn.svm.classes import NuSVC as NuSVCClass
-
-            if isinstance(estimator, NuSVCClass):
-                from sklearn_porter.estimator.NuSVC import NuSVC
-
-                return NuSVC(est)
-        elif name == 'KNeighborsClassifier':
-            from sklearn.neighbors.classification import (
-                KNeighborsClassifier as KNeighborsClassifierClass,
-            )
-
-            if isinstance(estimator, KNeighborsClassifierClass):
-                from sklearn_porter.estimator.KNeighborsClassifier import (
-                    KNeighborsClassifier,
-                )
-
-                return KNeighborsClassifier(est)
-        elif name == 'GaussianNB':
-            from sklearn.naive_bayes import GaussianNB as GaussianNBClass
-
-            if isinstance(estimator, GaussianNBClass):
-                from sklearn_porter.estimator.GaussianNB import GaussianNB
-
-                return GaussianNB(est)
-        elif name == 'BernoulliNB':
-            from sklearn.naive_bayes import BernoulliNB as BernoulliNBClass
-
-            if isinstance(estimator, BernoulliNBClass):
-                from sklearn_porter.estimator.BernoulliNB import BernoulliNB
-
-                return BernoulliNB(est)
-        elif name == 'MLPClassifier':
-            try:
-                from sklearn.neural_network.multilayer_perceptron import (
-                    MLPClassifier as MLPClassifierClass,
-                )
-            except ImportError:
-                msg = msg.format(sklearn_version, name)
-                L.error(msg)
-                raise ValueError(msg)
-            else:
-                if isinstance(estimator, MLPClassifierClass):
-                    from sklearn_porter.estimator.MLPClassifier import (
-                        MLPClassifier,
-                    )
-
-                    return MLPClassifier(est)
+        name = est.__class__.__qualname__
 
-        # Regressors:
-        elif name == 'MLPRegressor':
+        if name in _DISPATCH.keys():
+            sklearn_module, porter_module = _DISPATCH.get(name)
             try:
-                from sklearn.neural_network.multilayer_perceptron import (
-                    MLPRegressor as MLPRegressorClass,
-                )
-            except ImportError:
-                msg = msg.format(sklearn_version, name)
+                sklearn_clazz = _import_class(sklearn_module, name)
+            except (ImportError, AttributeError):
+                msg = (
+                    'Your installed version of scikit-learn v{} does not '
+                    'support the `{}` estimator. Please update your local '
+                    'installation of scikit-learn with '
+                    '`pip install -U scikit-learn`.'
+                ).format(sklearn_version, name)
                 L.error(msg)
                 raise ValueError(msg)
-            else:
-                if isinstance(estimator, MLPRegressorClass):
-                    from sklearn_porter.estimator.MLPRegressor import (
-                        MLPRegressor,
-                    )
-
-                    return MLPRegressor(est)
+            if isinstance(est, sklearn_clazz):
+                porter_clazz = _import_class(porter_module, name)
+                return porter_clazz(est)
 
         msg = 'The passed estimator `{}` is not supported.'.format(name)
         raise exception.NotSupportedYetError(msg)
@@ -581,7 +503,8 @@ class Estimator:
         x : Union[List, np.ndarray] of shape (n_samples, n_features) or (n_features)
             Input data.
         n_jobs : Union[bool, int] (default: True, which uses `count_cpus()`)
-            The number of processes to make the predictions.
+            The number of threads to make the predictions concurrently.
+            Each prediction is made by a separate system call.
         directory : Optional[Union[str, Path]] (default: current working dir)
             Set the directory where all generated files should be saved.
         delete_created_files : bool (default: True)
@@ -626,39 +549,14 @@ class Estimator:
         template = self._template
 
         # Compilation:
-        self._compile(src_path, class_paths, created_files, language, template)
+        cmd_args = self._compile(
+            src_path, class_paths, created_files, language, template
+        )
 
         # Execution:
-        cmd = language.value.CMD_EXECUTE
-        cmd_args = {}
-
-        if language in (enum.Language.C, enum.Language.GO):
-            cmd_args['dest_path'] = str(src_path.parent / src_path.stem)
-        elif language is enum.Language.JAVA:
-            if bool(class_paths):
-                cmd_args['class_path'] = '-cp ' + ':'.join(class_paths)
-            cmd_args['dest_path'] = str(src_path.stem)
-        elif language in (
-            enum.Language.JS, enum.Language.PHP, enum.Language.RUBY
-        ):
-            cmd_args['src_path'] = str(src_path)
-
-        paths_to_check = []
-        if 'src_path' in cmd_args.keys():
-            paths_to_check.append(cmd_args.get('src_path'))
-        if 'dest_path' in cmd_args.keys():
-            paths_to_check.append(cmd_args.get('dest_path'))
-        for path_to_check in paths_to_check:
-            for _ in range(10):
-                try:
-                    fp = open(path_to_check)
-                except IOError:
-                    sleep(0.1)
-                else:
-                    fp.close()
-                    break
-
-        cmd = cmd.format(**cmd_args)
+        if language is enum.Language.JAVA:
+            cmd_args['dest_path'] = src_path.stem  # the main class
+        cmd = language.value.CMD_EXECUTE.format(**cmd_args)
         L.info('Execution command: `{}`'.format(cmd))
 
         # Model data:
@@ -669,10 +567,12 @@ class Estimator:
             x = np.array(x)
         if x.ndim == 1:
             x = x[np.newaxis, :]
-        x = x.tolist()
+        buf = BytesIO()
+        np.savetxt(buf, x, fmt='%.17g', delimiter=' ')  # lossless
+        x = buf.getvalue().decode('utf-8').splitlines()
 
         # Command:
-        x = [cmd + json_path + ' '.join(list(map(str, e))) for e in x]
+        x = [cmd + json_path + e for e in x]
         calls = partial(_system_call, executable=shell_executable)
 
         if isinstance(n_jobs, int) and n_jobs <= 1:
@@ -685,10 +585,13 @@ class Estimator:
                 n_jobs = cpu_count()
             if not isinstance(n_jobs, int):
                 n_jobs = cpu_count()
-            with Pool(n_jobs) as pool:
-                y = pool.map(calls, x)
-        y = list(zip(*y))
-        y = list(map(np.array, y))
+            # The threads only wait for their subprocesses:
+            with ThreadPoolExecutor(n_jobs) as executor:
+                y = list(executor.map(calls, x))
+
+        # Assemble the outputs column by column:
+        y_pred = np.array([e[0] for e in y])
+        y_proba = np.array([e[1] for e in y]) if len(y[0]) > 1 else None
 
         # Delete generated files finally:
         if delete_created_files:
@@ -696,20 +599,18 @@ class Estimator:
                 if path and path.exists():
                     remove(str(path))
 
-        if len(y) == 1:  # predict
-            if len(y[0]) == 1:
-                return y[0][0], None
-            return y[0], None
-        else:
-            if len(y[0]) == 1:  # predict, predict_proba
-                return y[0][0], y[1][0]
-            return y[0], y[1]
+        if len(y_pred) == 1:  # single sample
+            if y_proba is None:
+                return y_pred[0], None
+            return y_pred[0], y_proba[0]
+        return y_pred, y_proba
 
     @staticmethod
     def _check_dependencies(language: enum.Language):
         # is_windows = platform in ('cygwin', 'win32', 'win64')
+        path = environ.get('PATH', '')
         for app in language.value.DEPENDENCIES:
-            if not which(app):
+            if not _which(app, path):
                 msg = 'Required dependency `{}` is missing.'.format(app)
                 raise RuntimeError(msg)
 
@@ -717,7 +618,7 @@ class Estimator:
     def _compile(
         src_path: Path, class_paths: List, created_files: List,
         language: enum.Language, template: enum.Template
-    ):
+    ) -> Dict[str, str]:
         """
         Execute a compilation.
 
@@ -733,21 +634,23 @@ class Estimator:
             The requested programming language.
         template
             The requested template.
+
+        Returns
+        -------
+        The arguments for the compilation and execution commands.
         """
+        dest_path = src_path.with_suffix('')
+        cmd_args = dict(src_path=str(src_path), dest_path=str(dest_path))
+
         cmd = language.value.CMD_COMPILE
 
         if not cmd:
-            return
-
-        cmd_args = {}
+            return cmd_args
 
         if language in (enum.Language.C, enum.Language.GO):
-            cmd_args['src_path'] = str(src_path)
-            cmd_args['dest_path'] = str(src_path.parent / src_path.stem)
-            created_files.append((src_path.parent / src_path.stem))
+            created_files.append(dest_path)
 
         elif language is enum.Language.JAVA:
-            cmd_args['src_path'] = str(src_path)
             cmd_args['dest_dir'] = '-d {}'.format(str(src_path.parent))
             class_paths.append(str(src_path.parent))
             created_files.append((src_path.parent / (src_path.stem + '.class')))
@@ -763,12 +666,8 @@ class Estimator:
                         environ.get('SKLEARN_PORTER_PYTEST_GSON_PATH')
                     )
                 else:
-                    path = src_path.parent / 'gson.jar'
-                    if not path.exists():
-                        url = language.value.GSON_DOWNLOAD_URI
-                        urllib.request.urlretrieve(url, str(path))
-                        created_files.append(path)
-                    class_paths.append(str(path))
+                    url = language.value.GSON_DOWNLOAD_URI
+                    class_paths.append(str(_get_gson(url)))
 
             if bool(class_paths):
                 cmd_args['class_path'] = '-cp ' + ':'.join(class_paths)
@@ -776,17 +675,13 @@ class Estimator:
         cmd = cmd.format(**cmd_args)
         L.info('Compilation command: `{}`'.format(cmd))
 
-        subp_args = dict(
-            shell=True,
-            universal_newlines=True,
-            stderr=STDOUT,
-            executable='/bin/bash'
-        )
+        # Run the compiler directly without a shell in between:
+        subp_args = dict(universal_newlines=True, stderr=STDOUT)
         try:
-            check_output(cmd, **subp_args)
+            check_output(shlex.split(cmd), **subp_args)
         except CalledProcessError as e:
             msg = 'Command "{}" return with error (code {}):\n\n{}'
-            msg = msg.format(e.cmd, e.returncode, e.output)
+            msg = msg.format(cmd, e.returncode, e.output)
             if language is enum.Language.JAVA:
                 if 'code too large' in e.output:
                     raise exception.CodeTooLarge(msg)
@@ -794,6 +689,8 @@ class Estimator:
                     raise exception.TooManyConstants(msg)
             raise exception.CompilationFailed(msg)
 
+        return cmd_args
+
     @decorator.alias('integrity_score')
     def test(
         self,
@@ -812,7 +709,8 @@ class Estimator:
         x : numpy.ndarray, shape (n_samples, n_features)
             Input data.
         n_jobs : Union[bool, int] (default: True, which uses `count_cpus()`)
-            The number of processes to make the predictions.
+            The number of threads to make the predictions concurrently.
+            Each prediction is made by a separate system call.
         directory : Optional[Union[str, Path]] (default: current working dir)
             Set the directory where all generated files should be saved.
         delete_created_files : bool (default: True)
@@ -849,43 +747,7 @@ class Estimator:
         estimators : Tuple
             A set of supported classifiers.
         """
-
-        # scikit-learn version < 0.18.0
-        from sklearn.tree.tree import DecisionTreeClassifier
-        from sklearn.ensemble.weight_boosting import AdaBoostClassifier
-        from sklearn.ensemble.forest import RandomForestClassifier
-        from sklearn.ensemble.forest import ExtraTreesClassifier
-        from sklearn.svm.classes import LinearSVC
-        from sklearn.svm.classes import SVC
-        from sklearn.svm.classes import NuSVC
-        from sklearn.neighbors.classification import KNeighborsClassifier
-        from sklearn.naive_bayes import GaussianNB
-        from sklearn.naive_bayes import BernoulliNB
-
-        classifiers = (
-            AdaBoostClassifier,
-            BernoulliNB,
-            DecisionTreeClassifier,
-            ExtraTreesClassifier,
-            GaussianNB,
-            KNeighborsClassifier,
-            LinearSVC,
-            NuSVC,
-            RandomForestClassifier,
-            SVC,
-        )
-
-        # scikit-learn version >= 0.18.0
-        try:
-            from sklearn.neural_network.multilayer_perceptron import (
-                MLPClassifier,
-            )
-        except ImportError:
-            pass
-        else:
-            classifiers += (MLPClassifier, )
-
-        return classifiers
+        return _find_classes(_CLASSIFIERS)
 
     @staticmethod
     def regressors() -> Tuple:
@@ -897,21 +759,7 @@ class Estimator:
         estimators : Tuple
             A set of supported regressors.
         """
-
-        # scikit-learn version < 0.18.0
-        regressors = ()
-
-        # scikit-learn version >= 0.18.0
-        try:
-            from sklearn.neural_network.multilayer_perceptron import (
-                MLPRegressor,
-            )
-        except ImportError:
-            pass
-        else:
-            regressors += (MLPRegressor, )
-
-        return regressors
+        return _find_classes(_REGRESSORS)
 
     def __repr__(self):
         """
@@ -944,21 +792,165 @@ class Estimator:
 
 
 def _get_qualname(obj: object):
-    return obj.__class__.__module__ + '.' + obj.__class__.__qualname__
+    clazz = obj if isinstance(obj, type) else obj.__class__
+    return clazz.__module__ + '.' + clazz.__qualname__
+
+
+# The handler of the logger and its level:
+_LOGGING_HANDLER = None  # type: Optional[int]
+_LOGGING_LEVEL = None  # type: Optional[int]
+
+
+def _configure_logging(level: int):
+    """
+    Log to stdout with the passed level. Replace the basic logger only
+    the first time and reuse the handler as long as the level is the same.
+
+    Parameters
+    ----------
+    level : int
+        The minimal logging level.
+    """
+    global _LOGGING_HANDLER, _LOGGING_LEVEL  # pylint: disable=global-statement
+    if _LOGGING_HANDLER is not None and level == _LOGGING_LEVEL:
+        return
+    try:
+        L.remove(_LOGGING_HANDLER)  # None removes the basic logger as well
+    except ValueError:  # the handler has been removed by the user
+        pass
+    _LOGGING_HANDLER = L.add(stdout, level=level)
+    _LOGGING_LEVEL = level
+
+
+@lru_cache(maxsize=None)
+def _import_class(module: str, name: str) -> type:
+    """
+    Import a class once and cache it for further requests.
+
+    Parameters
+    ----------
+    module : str
+        The absolute name of the module.
+    name : str
+        The name of the class.
+
+    Returns
+    -------
+    The imported class.
+    """
+    return getattr(import_module(module), name)
 
 
-def _system_call(cmd: str, executable='/bin/bash'):
+def _get_gson(url: str) -> Path:
     """
-    Separate helper function for multi-processed system calls.
+    Download the Gson library once into the user's cache directory.
+
+    Parameters
+    ----------
+    url : str
+        The download URL of the JAR file.
+
+    Returns
+    -------
+    The absolute path to the cached JAR file.
+    """
+    cache_dir = environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    path = Path(cache_dir) / 'sklearn-porter' / 'gson.jar'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Parallel downloads don't interfere due to the atomic rename
+        # of unique temporary files:
+        L.info('Download `{}` to `{}`.', url, path)
+        for attempt in range(3):
+            fd, tmp_path = mkstemp(dir=str(path.parent), prefix='.' + path.name)
+            try:
+                with open(fd, 'wb') as dst, \
+                        urllib.request.urlopen(url) as src:
+                    copyfileobj(src, dst, 1 << 20)
+                if getsize(tmp_path) == 0:
+                    raise OSError('The downloaded file is empty.')
+            except OSError as e:
+                remove(tmp_path)
+                if attempt == 2:
+                    raise
+                L.warning('Download failed ({}), try again.', e)
+                sleep(0.5 * 2**attempt)
+            else:
+                chmod(tmp_path, 0o644)  # `mkstemp` creates private files
+                replace(tmp_path, str(path))
+                break
+    return path
+
+
+@lru_cache(maxsize=None)
+def _find_classes(names: Tuple[str]) -> Tuple:
+    """
+    Import and cache the installed estimator classes of scikit-learn.
+
+    Parameters
+    ----------
+    names : Tuple[str]
+        The names of the supported estimator classes.
+
+    Returns
+    -------
+    The installed estimator classes.
+    """
+    return tuple(filter(None, map(_find_class, names)))
+
+
+def _find_class(name: str) -> Optional[type]:
+    """
+    Import a supported estimator class of scikit-learn if it's installed.
+
+    Parameters
+    ----------
+    name : str
+        The name of the estimator class.
+
+    Returns
+    -------
+    The imported class or None.
+    """
+    try:
+        return _import_class(_DISPATCH.get(name)[0], name)
+    except (ImportError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _which(app: str, path: str) -> Optional[str]:
+    """
+    Locate an executable once per value of the environment variable `PATH`.
+
+    Parameters
+    ----------
+    app : str
+        The name of the executable.
+    path : str
+        The searched directories, separated by `os.pathsep`.
+
+    Returns
+    -------
+    The absolute path to the executable or None.
+    """
+    return which(app, path=path)
+
+
+def _system_call(cmd: str, executable='/bin/bash') -> List:
+    """
+    Separate helper function for concurrent system calls.
 
     Parameters
     ----------
     cmd : str
         The command for the system call.
+    executable : str
+        The shell which executes the command.
 
     Returns
     -------
-    The output of subprocess.check_output.
+    The parsed output of subprocess.check_output.
     """
     subp_args = dict(
         shell=True,
@@ -973,7 +965,7 @@ def _system_call(cmd: str, executable='/bin/bash'):
             sleep(0.1)
         else:
             try:
-                out = loads(out, encoding='utf-8')
+                out = loads(out)
             except JSONDecodeError as e:
                 L.error(e)
             else:
@@ -984,6 +976,9 @@ def _system_call(cmd: str, executable='/bin/bash'):
                         result.append(out.get('predict_proba'))
                 return result
 
+    msg = 'The system call `{}` failed.'.format(cmd)
+    raise RuntimeError(msg)
+
 
 def show(language: Optional[Union[str, enum.Language]] = None):
     """
@@ -999,29 +994,29 @@ def show(language: Optional[Union[str, enum.Language]] = None):
     -------
     Show the table.
     """
+    from tabulate import tabulate
+
     languages = enum.LANGUAGES
     if language:
         language = enum.Language.convert(language)
         languages = {language.value.KEY: language.value}
     headers = ['Estimator'] + [l.LABEL for l in languages.values()]
     clazzes = Estimator.classifiers() + Estimator.regressors()
-    clazzes = {_get_qualname(c()): c() for c in clazzes}
+    clazzes = {_get_qualname(c): c for c in clazzes}
     clazzes = OrderedDict(sorted(clazzes.items()))
     table = []
     templates = dict(attached='ᴀ', combined='ᴄ', exported='ᴇ')
     for name, est in clazzes.items():
+        support = _get_support(est.__name__)
         tr = [name]
         for lang in languages.keys():
+            lang_support = support.get(enum.Language.convert(lang), {})
             td = []
             for tpl in templates.keys():
-                if can(
-                    estimator=est,
-                    language=lang,
-                    template=tpl,
-                    method='predict_proba'
-                ):
+                methods = lang_support.get(enum.Template.convert(tpl))
+                if methods and enum.Method.PREDICT_PROBA in methods:
                     out = '✓{}ᴾ'.format(templates.get(tpl))
-                elif can(estimator=est, language=lang, template=tpl):
+                elif methods is not None:
                     out = '✓{} '.format(templates.get(tpl))
                 else:
                     out = '···'
@@ -1039,7 +1034,7 @@ def show(language: Optional[Union[str, enum.Language]] = None):
 
 
 def can(
-    estimator: Union[BaseEstimator, ABCMeta],
+    estimator: Union[BaseEstimator, type],
     language: Optional[Union[str, enum.Language]] = None,
     template: Optional[Union[str, enum.Template]] = None,
     method: Optional[Union[str, enum.Method]] = None
@@ -1049,7 +1044,7 @@ def can(
 
     Parameters
     ----------
-    estimator : BaseEstimator or abstract ABCMeta class.
+    estimator : BaseEstimator or class of an estimator.
         Set a fitted base estimator of scikit-learn.
     language : str
         Set the target programming language.
@@ -1065,22 +1060,61 @@ def can(
 
     if isinstance(estimator, BaseEstimator):
         name = estimator.__class__.__name__
-    elif isinstance(estimator, ABCMeta):
+    elif isinstance(estimator, type):
         name = estimator.__name__
     else:
         return False
 
-    cands = Estimator.classifiers() + Estimator.regressors()
-    cands = [c.__name__ for c in cands]
+    return _can(name, language, template, method)
+
+
+def _get_support(name: str) -> Dict:
+    """
+    Get the supported languages, templates and methods of an estimator.
+
+    Parameters
+    ----------
+    name : str
+        The class name of the estimator.
+
+    Returns
+    -------
+    The `SUPPORT` mapping of the estimator class of sklearn-porter.
+    """
+    return _import_class(_DISPATCH.get(name)[1], name).SUPPORT
+
 
-    if name not in cands:
+@lru_cache(maxsize=None)
+def _can(
+    name: str,
+    language: Optional[Union[str, enum.Language]] = None,
+    template: Optional[Union[str, enum.Template]] = None,
+    method: Optional[Union[str, enum.Method]] = None
+) -> bool:
+    """
+    Check and cache the support of the estimator with the given name.
+
+    Parameters
+    ----------
+    name : str
+        The class name of the estimator.
+    language : str
+        Set the target programming language.
+    template : str
+        Set the kind of desired template.
+    method : str
+        Set the kind of template.
+
+    Returns
+    -------
+    True by a supported combination.
+    """
+    # Is the estimator supported and installed?
+    if name not in _DISPATCH.keys() or not _find_class(name):
         return False
 
     if language or template or method:
-        pckg = 'sklearn_porter.estimator.{}'.format(name)
-        module = __import__(pckg, globals(), locals(), [name], 0)
-        clazz = getattr(module, name)
-        support = getattr(clazz, 'SUPPORT')
+        support = _get_support(name)
     else:
         return True
 
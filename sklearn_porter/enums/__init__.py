@@ -18,7 +18,7 @@ class Method(Enum):
         return method
 
 
-ALL_METHODS = {Method.PREDICT, Method.PREDICT_PROBA}
+ALL_METHODS = frozenset({Method.PREDICT, Method.PREDICT_PROBA})
 
 
 class Template(Enum):
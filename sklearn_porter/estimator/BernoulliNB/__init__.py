@@ -1,5 +1,3 @@
-from copy import deepcopy
-from json import dumps, encoder
 from typing import Tuple, Union, Callable
 
 from loguru import logger as L
@@ -51,15 +49,15 @@ class BernoulliNB(EstimatorBase, EstimatorApiABC):
             n_features=len(est.feature_log_prob_[0]),
             n_classes=len(est.classes_),
         )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
         self.model_data = dict(
             priors=est.class_log_prior_.tolist(),  # class_log_prior
             probs=est.feature_log_prob_.tolist(),  # feature_log_prob
         )
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
     def port(
         self,
@@ -93,7 +91,7 @@ class BernoulliNB(EstimatorBase, EstimatorApiABC):
         The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -107,8 +105,7 @@ class BernoulliNB(EstimatorBase, EstimatorApiABC):
         if template == enum.Template.EXPORTED:
             tpl_class = tpls.get_template('exported.class')
             out_class = tpl_class.render(**plas)
-            encoder.FLOAT_REPR = lambda o: converter(o)
-            model_data = dumps(self.model_data, separators=(',', ':'))
+            model_data = self._dumps(self.model_data, converter)
             return out_class, model_data
 
         # Make 'attached' variant:
@@ -134,7 +131,7 @@ class BernoulliNB(EstimatorBase, EstimatorApiABC):
             values=', '.join(
                 list(
                     tpl_in_brackets.render(
-                        value=', '.join(list(map(converter, v)))
+                        value=', '.join(map(converter, v))
                     ) for v in probs_val
                 )
             ),
@@ -1,14 +1,12 @@
-from copy import deepcopy
-from json import dumps, encoder
 from textwrap import indent
 from typing import Callable, Tuple, Union
 
+import numpy as np
 from jinja2 import Environment
 from loguru import logger as L
 
 # scikit-learn
-from sklearn.tree.tree import \
-    DecisionTreeClassifier as DecisionTreeClassifierClass
+from sklearn.tree import DecisionTreeClassifier as DecisionTreeClassifierClass
 
 # sklearn-porter
 from sklearn_porter import enums as enum
@@ -77,19 +75,19 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
             n_features=est.n_features_,
             n_classes=len(est.tree_.value.tolist()[0][0]),
         )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
         # Extract and save model data:
         self.model_data = dict(
-            lefts=est.tree_.children_left.tolist(),
-            rights=est.tree_.children_right.tolist(),
-            thresholds=est.tree_.threshold.tolist(),
-            indices=est.tree_.feature.tolist(),
-            classes=[[int(c) for c in l[0]] for l in est.tree_.value.tolist()],
+            lefts=est.tree_.children_left,
+            rights=est.tree_.children_right,
+            thresholds=est.tree_.threshold,
+            indices=est.tree_.feature,
+            classes=est.tree_.value[:, 0, :].astype(int),
         )
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
     def port(
         self,
@@ -124,7 +122,7 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
             The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -138,9 +136,7 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
         if template == enum.Template.EXPORTED:
             tpl_class = tpls.get_template('exported.class')
             out_class = tpl_class.render(**plas)
-            # converter = kwargs.get('converter')
-            encoder.FLOAT_REPR = lambda o: converter(o)
-            model_data = dumps(self.model_data, separators=(',', ':'))
+            model_data = self._dumps(self.model_data, converter)
             return out_class, model_data
 
         # Make 'atatched' or 'combined' variant:
@@ -152,23 +148,27 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
         tpl_in_brackets = tpls.get_template('in_brackets')
 
         # Make contents:
-        lefts_val = list(map(str, self.model_data.get('lefts')))
-        lefts_str = tpl_arr_1.render(
-            type=tpl_int,
-            name='lefts',
-            values=', '.join(lefts_val),
-            n=len(lefts_val),
-        )
+        # The integer arrays have the same length, so format them at once:
+        names = ('lefts', 'rights', 'indices')
+        values = np.vstack([self.model_data.get(name) for name in names])
+        values = np.char.mod('%d', values).tolist()
+        ints_str = {
+            name: tpl_arr_1.render(
+                type=tpl_int,
+                name=name,
+                values=', '.join(vals),
+                n=len(vals),
+            )
+            for name, vals in zip(names, values)
+        }
 
-        rights_val = list(map(str, self.model_data.get('rights')))
-        rights_str = tpl_arr_1.render(
-            type=tpl_int,
-            name='rights',
-            values=', '.join(rights_val),
-            n=len(rights_val),
+        # Convert each distinct threshold only once (e.g. all leaves are -2):
+        thresholds_val, inverse = np.unique(
+            self.model_data.get('thresholds'), return_inverse=True
         )
-
-        thresholds_val = list(map(converter, self.model_data.get('thresholds')))
+        thresholds_val = list(map(converter, thresholds_val.tolist()))
+        thresholds_val = np.array(thresholds_val, dtype=object)[inverse]
+        thresholds_val = thresholds_val.tolist()
         thresholds_str = tpl_arr_1.render(
             type=tpl_double,
             name='thresholds',
@@ -176,20 +176,11 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
             n=len(thresholds_val),
         )
 
-        indices_val = list(map(str, self.model_data.get('indices')))
-        indices_str = tpl_arr_1.render(
-            type=tpl_int,
-            name='indices',
-            values=', '.join(indices_val),
-            n=len(indices_val),
-        )
-
-        classes_val = [
-            list(map(str, e)) for e in self.model_data.get('classes')
-        ]
-        classes_str = [', '.join(e) for e in classes_val]
+        classes_val = np.char.mod('%d', self.model_data.get('classes')).tolist()
+        # Render the brackets once and wrap all rows with them:
+        pre, suf = tpl_in_brackets.render(value='\0').split('\0')
         classes_str = ', '.join(
-            [tpl_in_brackets.render(value=e) for e in classes_str]
+            [pre + ', '.join(e) + suf for e in classes_val]
         )
         classes_str = tpl_arr_2.render(
             type=tpl_int,
@@ -199,15 +190,11 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
             m=len(classes_val[0]),
         )
 
-        plas.update(
-            dict(
-                lefts=lefts_str,
-                rights=rights_str,
-                thresholds=thresholds_str,
-                indices=indices_str,
-                classes=classes_str,
-            )
-        )
+        plas.update(ints_str)
+        plas.update(dict(
+            thresholds=thresholds_str,
+            classes=classes_str,
+        ))
 
         # Make 'attached' variant:
         if template == enum.Template.ATTACHED:
@@ -255,17 +242,17 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
             tpls,
             language,
             converter,
-            self.model_data.get('lefts'),
-            self.model_data.get('rights'),
-            self.model_data.get('thresholds'),
-            self.model_data.get('classes'),
-            self.model_data.get('indices'),
+            self.model_data.get('lefts').tolist(),
+            self.model_data.get('rights').tolist(),
+            self.model_data.get('thresholds').tolist(),
+            self.model_data.get('classes').tolist(),
+            self.model_data.get('indices').tolist(),
             0,
             n_indents,
         )
 
+    @staticmethod
     def _create_branch(
-        self,
         tpls: Environment,
         language: enum.Language,
         converter: Callable[[object], str],
@@ -307,69 +294,55 @@ class DecisionTreeClassifier(EstimatorBase, EstimatorApiABC):
         -------
         A single branch of a DecisionTreeClassifier.
         """
-        out = ''
         out_indent = tpls.get_template('indent').render()
-        if threshold[node] != -2.0:
-            out += '\n'
-            val_a = 'features[{}]'.format(features[node])
-            if language is enum.Language.PHP:
-                val_a = '$' + val_a
-            val_b = converter(threshold[node])
-            tpl_if = tpls.get_template('if')
-            out_if = tpl_if.render(a=val_a, op='<=', b=val_b)
-            out_if = indent(out_if, depth * out_indent)
-            out += out_if
-
-            if left_nodes[node] != -1.0:
-                out += self._create_branch(
-                    tpls,
-                    language,
-                    converter,
-                    left_nodes,
-                    right_nodes,
-                    threshold,
-                    value,
-                    features,
-                    left_nodes[node],
-                    depth + 1,
-                )
-
-            out += '\n'
-            out_else = tpls.get_template('else').render()
-            out_else = indent(out_else, depth * out_indent)
-            out += out_else
-
-            if right_nodes[node] != -1.0:
-                out += self._create_branch(
-                    tpls,
-                    language,
-                    converter,
-                    left_nodes,
-                    right_nodes,
-                    threshold,
-                    value,
-                    features,
-                    right_nodes[node],
-                    depth + 1,
+        # Render the condition once with gaps for the operands:
+        out_if = tpls.get_template('if').render(a='\0', op='<=', b='\0')
+        out_else = tpls.get_template('else').render()
+        out_endif = tpls.get_template('endif').render()
+        out_join = tpls.get_template('join').render()
+
+        tpl_clazz = 'classes[{0}] = {1}'
+        tpl_feature = 'features[{}]'
+        if language is enum.Language.PHP:
+            tpl_clazz = '$' + tpl_clazz
+            tpl_feature = '$' + tpl_feature
+
+        # Indented templates by depth:
+        tpls_depth = {}
+
+        # Walk the tree depth-first with an explicit stack of nodes
+        # and closing strings instead of recursive calls per node:
+        out = []
+        stack = [(node, depth)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                out.append(item)
+                continue
+            node, depth = item
+            if depth not in tpls_depth:
+                prefix = depth * out_indent
+                tpls_depth[depth] = (
+                    ('\n' + indent(out_if, prefix)).split('\0'),
+                    '\n' + indent(out_else, prefix),
+                    '\n' + indent(out_endif, prefix),
+                    '\n' + indent(tpl_clazz, prefix),
                 )
-
-            out += '\n'
-            out_endif = tpls.get_template('endif').render()
-            out_endif = indent(out_endif, depth * out_indent)
-            out += out_endif
-        else:
-            clazzes = []
-            tpl = 'classes[{0}] = {1}'
-            if language is enum.Language.PHP:
-                tpl = '$' + tpl
-            tpl = indent(tpl, depth * out_indent)
-
-            for i, rate in enumerate(value[node]):
-                if int(rate) > 0:
-                    clazz = tpl.format(i, rate)
-                    clazz = '\n' + clazz
-                    clazzes.append(clazz)
-
-            out_join = tpls.get_template('join').render()
-            out += out_join.join(clazzes) + out_join
-        return out
+            tpl_if, tpl_else, tpl_endif, tpl = tpls_depth[depth]
+            if threshold[node] != -2.0:
+                val_a = tpl_feature.format(features[node])
+                val_b = converter(threshold[node])
+                out.append(tpl_if[0] + val_a + tpl_if[1] + val_b + tpl_if[2])
+                stack.append(tpl_endif)
+                if right_nodes[node] != -1.0:
+                    stack.append((right_nodes[node], depth + 1))
+                stack.append(tpl_else)
+                if left_nodes[node] != -1.0:
+                    stack.append((left_nodes[node], depth + 1))
+            else:
+                clazzes = [
+                    tpl.format(i, rate)
+                    for i, rate in enumerate(value[node]) if rate > 0
+                ]
+                out.append(out_join.join(clazzes) + out_join)
+        return ''.join(out)
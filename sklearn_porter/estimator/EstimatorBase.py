@@ -1,7 +1,11 @@
-from os import environ, getcwd
+from functools import lru_cache
+from json import dumps
+from math import isfinite
+from os import chmod, environ, fsync, getcwd, remove, replace
+from os.path import exists
 from pathlib import Path
-from time import sleep
-from typing import Dict, Optional, Set, Tuple, Union, Callable
+from tempfile import mkstemp
+from typing import Callable, Dict, FrozenSet, Optional, Tuple, Union
 
 from jinja2 import DictLoader, Environment
 from loguru import logger as L
@@ -14,6 +18,7 @@ from sklearn.base import BaseEstimator
 from sklearn_porter import __version__ as sklearn_porter_version
 from sklearn_porter import enums as enum
 from sklearn_porter.estimator.EstimatorApiABC import EstimatorApiABC
+from sklearn_porter.utils import default_converter
 
 
 class EstimatorBase(EstimatorApiABC):
@@ -25,7 +30,7 @@ class EstimatorBase(EstimatorApiABC):
     DEFAULT_METHOD = None  # type: enum.Method
     DEFAULT_TEMPLATE = None  # type: enum.Template
 
-    SUPPORT = None  # type: Dict[enum.Language, Dict[enum.Template, Set[enum.Method]]]
+    SUPPORT = None  # type: Dict[enum.Language, Dict[enum.Template, FrozenSet[enum.Method]]]
 
     estimator = None  # type: BaseEstimator
     estimator_name = None  # type: str
@@ -158,21 +163,55 @@ class EstimatorBase(EstimatorApiABC):
         suffix = language.value.SUFFIX
         filename = class_name + '.' + suffix
         filepath = directory / filename
-        filepath.write_text(ported[0], encoding='utf-8')
-        while not filepath.exists():
-            sleep(0.01)
+        _write_text(filepath, ported[0])
         paths = str(filepath)
 
         # Dump model data:
         if template == enum.Template.EXPORTED and len(ported) == 2:
             json_path = directory / (class_name + '.json')
-            json_path.write_text(ported[1], encoding='utf-8')
-            while not json_path.exists():
-                sleep(0.01)
+            _write_text(json_path, ported[1])
             paths = (paths, str(json_path))
 
         return paths
 
+    @staticmethod
+    def _dumps(data: object, converter: Callable[[object], str]) -> str:
+        """
+        Serialize the model data as compact JSON string
+        and format all floating numbers with the converter.
+
+        Parameters
+        ----------
+        data : object
+            The model data, which can contain NumPy arrays.
+        converter : Callable
+            The converter of all floating numbers.
+
+        Returns
+        -------
+        The model data as JSON string.
+        """
+        # The default converter is a plain string cast and Python's `repr`
+        # of floats is identical, so let the C encoder of `json` do all:
+        if converter is str or converter is default_converter:
+            return dumps(data, separators=(',', ':'), default=_tolist)
+
+        def encode(obj: object) -> str:
+            if hasattr(obj, 'tolist'):  # NumPy arrays and scalars
+                obj = obj.tolist()
+            if isinstance(obj, float):
+                # Keep `NaN` and `Infinity`, which are valid JSON tokens:
+                return converter(obj) if isfinite(obj) else dumps(obj)
+            if isinstance(obj, (list, tuple)):
+                return '[' + ','.join([encode(e) for e in obj]) + ']'
+            if isinstance(obj, dict):
+                return '{' + ','.join(
+                    [dumps(str(k)) + ':' + encode(v) for k, v in obj.items()]
+                ) + '}'
+            return dumps(obj)
+
+        return encode(data)
+
     def _load_templates(
         self, language: Union[str, enum.Language]
     ) -> Environment:
@@ -197,46 +236,104 @@ class EstimatorBase(EstimatorApiABC):
             if isinstance(language, str) else language
         )
 
-        tpls = {}  # Dict
-
-        # 1. Load basic language templates (e.g. `if`, `else`, ...):
-        lang_tpls = language.TEMPLATES
-        if isinstance(language.TEMPLATES, dict):
-            tpls.update(lang_tpls)
-        L.debug(
-            'Load template variables: {}'.format(', '.join(lang_tpls.keys()))
-        )
-
-        # 2. Load base language templates (e.g. `base.attached.class`):
-        root_dir = Path(__file__).parent.parent
-        tpls_dir = root_dir / 'language' / language.KEY / 'templates'
+        return _load_templates(self.__class__, language)
+
+
+def _tolist(obj: object) -> object:
+    """Return the native Python values of NumPy arrays and scalars."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError('Object of type `{}` is not JSON serializable.'.format(
+        type(obj).__name__
+    ))
+
+
+def _write_text(path: Path, text: str):
+    """
+    Write a file atomically and durably, so that it's complete
+    and visible to other processes as soon as this call returns.
+
+    Parameters
+    ----------
+    path : Path
+        The absolute destination path.
+    text : str
+        The content of the file.
+    """
+    # A unique temporary file per call, so concurrent writes don't collide:
+    fd, tmp_path = mkstemp(dir=str(path.parent), prefix='.' + path.name)
+    try:
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            fsync(f.fileno())
+        chmod(tmp_path, 0o644)  # `mkstemp` creates private files
+        replace(tmp_path, str(path))
+    except BaseException:
+        if exists(tmp_path):
+            remove(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=None)
+def _load_templates(clazz: type, language: type) -> Environment:
+    """
+    Load and cache the templates of an estimator class and a language.
+
+    Parameters
+    ----------
+    clazz : type
+        The class of the estimator.
+    language : type
+        The class of the required language.
+
+    Returns
+    -------
+    environment : Environment
+        An Jinja environment with all loaded templates.
+    """
+    tpls = {}  # Dict
+
+    # 1. Load basic language templates (e.g. `if`, `else`, ...):
+    lang_tpls = language.TEMPLATES
+    if isinstance(language.TEMPLATES, dict):
+        tpls.update(lang_tpls)
+    L.debug('Load template variables: {}', ', '.join(lang_tpls.keys()))
+
+    # 2. Load base language templates (e.g. `base.attached.class`):
+    root_dir = Path(__file__).parent.parent
+    tpls_dir = root_dir / 'language' / language.KEY / 'templates'
+    if tpls_dir.exists():
+        tpls_paths = set(tpls_dir.glob('*.jinja2'))
+        tpls.update({path.stem: path.read_text() for path in tpls_paths})
+
+    # 3. Load specific templates from template files:
+    bases = list(set([base.__name__ for base in clazz.__bases__]))
+    if 'EstimatorBase' in bases:
+        bases.remove('EstimatorBase')
+    if 'EstimatorApiABC' in bases:
+        bases.remove('EstimatorApiABC')
+    bases.append(clazz.__name__)
+    est_dir = root_dir / 'estimator'
+    for base_dir in bases:
+        tpls_dir = est_dir / base_dir / 'templates' / language.KEY
         if tpls_dir.exists():
             tpls_paths = set(tpls_dir.glob('*.jinja2'))
-            tpls.update({path.stem: path.read_text() for path in tpls_paths})
-
-        # 3. Load specific templates from template files:
-        bases = list(set([base.__name__ for base in self.__class__.__bases__]))
-        if 'EstimatorBase' in bases:
-            bases.remove('EstimatorBase')
-        if 'EstimatorApiABC' in bases:
-            bases.remove('EstimatorApiABC')
-        bases.append(self.__class__.__name__)
-        est_dir = root_dir / 'estimator'
-        for base_dir in bases:
-            tpls_dir = est_dir / base_dir / 'templates' / language.KEY
-            if tpls_dir.exists():
-                tpls_paths = set(tpls_dir.glob('*.jinja2'))
-                tpls.update(
-                    {path.stem: path.read_text()
-                     for path in tpls_paths}
-                )
-
-        L.debug('Load template files: {}'.format(', '.join(tpls.keys())))
-
-        environment = Environment(
-            autoescape=False,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            loader=DictLoader(tpls),
-        )
-        return environment
+            tpls.update(
+                {path.stem: path.read_text()
+                 for path in tpls_paths}
+            )
+
+    L.opt(lazy=True).debug(
+        'Load template files: {}', lambda: ', '.join(tpls.keys())
+    )
+
+    environment = Environment(
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        loader=DictLoader(tpls),
+        auto_reload=False,
+        cache_size=-1,  # never evict compiled templates
+    )
+    return environment
@@ -1,5 +1,3 @@
-from copy import deepcopy
-from json import dumps, encoder
 from typing import Tuple, Union, Callable
 
 from loguru import logger as L
@@ -70,8 +68,8 @@ class KNeighborsClassifier(EstimatorBase, EstimatorApiABC):
             n_features=len(est._fit_X[0]),  # pylint: disable=W0212
             metric=est.metric
         )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
         self.model_data = dict(
             X=est._fit_X.tolist(),  # pylint: disable=W0212
@@ -80,8 +78,8 @@ class KNeighborsClassifier(EstimatorBase, EstimatorApiABC):
             n=len(est.classes_),  # number of classes
             power=est.p
         )
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
     def port(
         self,
@@ -115,7 +113,7 @@ class KNeighborsClassifier(EstimatorBase, EstimatorApiABC):
         The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -129,8 +127,7 @@ class KNeighborsClassifier(EstimatorBase, EstimatorApiABC):
         if template == enum.Template.EXPORTED:
             tpl_class = tpls.get_template('exported.class')
             out_class = tpl_class.render(**plas)
-            encoder.FLOAT_REPR = lambda o: converter(o)
-            model_data = dumps(self.model_data, separators=(',', ':'))
+            model_data = self._dumps(self.model_data, converter)
             return out_class, model_data
 
         # Pick templates:
@@ -148,7 +145,7 @@ class KNeighborsClassifier(EstimatorBase, EstimatorApiABC):
             values=', '.join(
                 list(
                     tpl_in_brackets.render(
-                        value=', '.join(list(map(converter, v)))
+                        value=', '.join(map(converter, v))
                     ) for v in x_val
                 )
             ),
@@ -1,5 +1,3 @@
-from copy import deepcopy
-from json import dumps, encoder
 from typing import Tuple, Union, Callable
 
 from loguru import logger as L
@@ -25,27 +23,27 @@ class LinearSVC(EstimatorBase, EstimatorApiABC):
 
     SUPPORT = {
         enum.Language.C: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.GO: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.JAVA: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.JS: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.PHP: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.RUBY: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         }
     }
 
@@ -67,8 +65,8 @@ class LinearSVC(EstimatorBase, EstimatorApiABC):
             n_classes=len(est.classes_),
             is_binary=len(est.classes_) == 2
         )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
         if self.meta_info['is_binary']:
             self.model_data = dict(
@@ -78,8 +76,8 @@ class LinearSVC(EstimatorBase, EstimatorApiABC):
             self.model_data = dict(
                 coeffs=est.coef_.tolist(), inters=est.intercept_.tolist()
             )
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
     def port(
         self,
@@ -113,7 +111,7 @@ class LinearSVC(EstimatorBase, EstimatorApiABC):
         The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -128,8 +126,7 @@ class LinearSVC(EstimatorBase, EstimatorApiABC):
             tpl_name = 'exported.class'
             tpl_class = tpls.get_template(tpl_name)
             out_class = tpl_class.render(**plas)
-            encoder.FLOAT_REPR = lambda o: converter(o)
-            model_data = dumps(self.model_data, separators=(',', ':'))
+            model_data = self._dumps(self.model_data, converter)
             return out_class, model_data
 
         # Make 'attached' variant:
@@ -172,7 +169,7 @@ class LinearSVC(EstimatorBase, EstimatorApiABC):
                 values=', '.join(
                     list(
                         tpl_in_brackets.render(
-                            value=', '.join(list(map(converter, v)))
+                            value=', '.join(map(converter, v))
                         ) for v in coeffs_val
                     )
                 ),
@@ -1,13 +1,10 @@
-from copy import deepcopy
-from json import dumps, encoder
 from typing import Tuple, Union, Callable
 
 import numpy as np
 from loguru import logger as L
 
 # scikit-learn
-from sklearn.neural_network.multilayer_perceptron import \
-    MLPClassifier as MLPClassifierClass
+from sklearn.neural_network import MLPClassifier as MLPClassifierClass
 
 # sklearn-porter
 from sklearn_porter import enums as enum
@@ -53,26 +50,27 @@ class MLPClassifier(EstimatorBase, EstimatorApiABC):
         n_inputs = len(est.coefs_[0])
         n_outputs = est.n_outputs_
         n_hidden_layers = est.hidden_layer_sizes
-        if isinstance(n_hidden_layers, int):
-            n_hidden_layers = [n_hidden_layers]
-        n_hidden_layers = list(n_hidden_layers)
+        n_hidden_layers = (
+            [n_hidden_layers]
+            if isinstance(n_hidden_layers, int) else list(n_hidden_layers)
+        )
         layers = [n_inputs] + n_hidden_layers + [n_outputs]
 
         self.meta_info = dict(n_features=n_inputs, )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
         self.model_data = dict(
             layers=list(map(int, layers[1:])),
-            weights=list(map(np.ndarray.tolist, est.coefs_)),
-            bias=list(map(np.ndarray.tolist, est.intercepts_)),
+            weights=est.coefs_,
+            bias=est.intercepts_,
             hidden_activation=est.activation,
         )
         if self.estimator_name == 'MLPClassifier':
             self.model_data['output_activation'] = est.out_activation_
 
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
     def port(
         self,
@@ -106,7 +104,7 @@ class MLPClassifier(EstimatorBase, EstimatorApiABC):
         The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -120,11 +118,12 @@ class MLPClassifier(EstimatorBase, EstimatorApiABC):
         if template == enum.Template.EXPORTED:
             tpl_class = tpls.get_template('exported.class')
             out_class = tpl_class.render(**plas)
-            encoder.FLOAT_REPR = lambda o: converter(o)
-            model_data = dumps(self.model_data, separators=(',', ':'))
+            model_data = self._dumps(self.model_data, converter)
             return out_class, model_data
 
         # Make 'attached' variant:
+        md = self.model_data  # alias
+
         # Pick templates:
         tpl_int = tpls.get_template('int').render()
         tpl_double = tpls.get_template('double').render()
@@ -134,47 +133,44 @@ class MLPClassifier(EstimatorBase, EstimatorApiABC):
         tpl_in_brackets = tpls.get_template('in_brackets')
 
         # Convert layers:
-        layers_val = self.model_data.get('layers')
+        layers_val = md['layers']
         layers_str = tpl_arr_1.render(
             type=tpl_int,
             name='layers',
-            values=', '.join(list(map(str, layers_val))),
+            values=', '.join(map(str, layers_val)),
             n=len(layers_val)
         )
 
+        # Apply the converter element-wise on whole arrays:
+        convert = np.frompyfunc(converter, 1, 1)
+
+        # Render the brackets once and wrap all rows with them:
+        pre, suf = tpl_in_brackets.render(value='\0').split('\0')
+        sep = suf + ', ' + pre
+
+        def wrap(rows: list) -> str:
+            return pre + sep.join(map(', '.join, rows)) + suf
+
         # Convert weights:
-        weights_val = self.model_data.get('weights')
-        weights_str = []
-        for layer in weights_val:
-            layer_weights = ', '.join(
-                [
-                    tpl_in_brackets.render(
-                        value=', '.join(list(map(converter, l)))
-                    ) for l in layer
-                ]
-            )
-            weights_str.append(tpl_in_brackets.render(value=layer_weights))
+        weights_val = md['weights']
+        weights_str = [
+            wrap(convert(np.asarray(layer)).tolist()) for layer in weights_val
+        ]
         weights_str = tpl_arr_3.render(
             type=tpl_double,
             name='weights',
-            values=', '.join(weights_str),
+            values=pre + sep.join(weights_str) + suf,
             n=len(weights_val),
             m=len(weights_val[0]),
             k=len(weights_val[0][0]),
         )
 
         # Convert bias:
-        bias_val = self.model_data.get('bias')
+        bias_val = md['bias']
         bias_str = tpl_arr_2.render(
             type=tpl_double,
             name='bias',
-            values=', '.join(
-                list(
-                    tpl_in_brackets.render(
-                        value=', '.join(list(map(converter, v)))
-                    ) for v in bias_val
-                )
-            ),
+            values=wrap([convert(np.asarray(v)).tolist() for v in bias_val]),
             n=len(bias_val),
             m=len(bias_val[0])
         )
@@ -184,8 +180,8 @@ class MLPClassifier(EstimatorBase, EstimatorApiABC):
                 layers=layers_str,
                 weights=weights_str,
                 bias=bias_str,
-                hidden_activation=self.model_data.get('hidden_activation'),
-                output_activation=self.model_data.get('output_activation'),
+                hidden_activation=md['hidden_activation'],
+                output_activation=md.get('output_activation'),
             )
         )
 
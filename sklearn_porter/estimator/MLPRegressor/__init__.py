@@ -1,6 +1,5 @@
 # scikit-learn
-from sklearn.neural_network.multilayer_perceptron import \
-    MLPRegressor as MLPRegressorClass
+from sklearn.neural_network import MLPRegressor as MLPRegressorClass
 
 # sklearn-porter
 from sklearn_porter import enums as enum
@@ -20,12 +19,12 @@ class MLPRegressor(MLPClassifier, EstimatorBase):
 
     SUPPORT = {
         enum.Language.JS: {
-            enum.Template.ATTACHED: {
+            enum.Template.ATTACHED: frozenset({
                 enum.Method.PREDICT,
-            },
-            enum.Template.EXPORTED: {
+            }),
+            enum.Template.EXPORTED: frozenset({
                 enum.Method.PREDICT,
-            },
+            }),
         },
     }
 
@@ -1,5 +1,3 @@
-from copy import deepcopy
-from json import dumps, encoder
 from textwrap import indent
 from typing import Callable, Dict, Tuple, Union
 
@@ -76,8 +74,8 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
             n_classes=est.n_classes_,
             n_features=est.estimators_[0].n_features_,
         )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
         # Extract and save model data:
         self.model_data['estimators'] = []
@@ -91,8 +89,8 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
                     indices=e.tree_.feature.tolist()
                 )
             )
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
     def port(
         self,
@@ -126,7 +124,7 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
         The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -135,14 +133,13 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
 
         # Templates:
         tpls = self._load_templates(language.value.KEY)
-        encoder.FLOAT_REPR = lambda o: converter(o)
 
         # Make 'exported' variant:
         if template == enum.Template.EXPORTED:
             tpl_class = tpls.get_template('exported.class')
             out_class = tpl_class.render(**plas)
             model_data = self.model_data.get('estimators')
-            model_data = dumps(model_data, separators=(',', ':'))
+            model_data = self._dumps(model_data, converter)
             return out_class, model_data
 
         # Make 'attached' variant:
@@ -150,7 +147,7 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
             tpl_class = tpls.get_template('attached.class')
             tpl_init = tpls.get_template('init')
             model_data = self.model_data.get('estimators')
-            model_data = dumps(model_data, separators=(',', ':'))
+            model_data = self._dumps(model_data, converter)
 
             if language is enum.Language.PHP:
                 model_data = "json_decode('" + model_data + "', true)"
@@ -181,7 +178,7 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
         tpl_calls = tpls.get_template('combined.method_calls')
         out_calls = []
         for idx in range(self.meta_info.get('n_estimators')):
-            plas_copy = deepcopy(plas)
+            plas_copy = dict(plas)
             plas_copy.update(dict(method_index=idx))
             out_call = tpl_calls.render(**plas_copy)
             out_calls.append(out_call)
@@ -193,7 +190,7 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
 
         # Make method:
         tpl_method = tpls.get_template('combined.method')
-        plas_copy = deepcopy(plas)
+        plas_copy = dict(plas)
         plas_copy.update(dict(methods=out_fns, method_calls=out_calls))
         out_method = tpl_method.render(**plas_copy)
 
@@ -204,7 +201,7 @@ class RandomForestClassifier(EstimatorBase, EstimatorApiABC):
 
         # Make class:
         tpl_class = tpls.get_template('combined.class')
-        copy_plas = deepcopy(plas)
+        copy_plas = dict(plas)
         copy_plas.update(dict(method=out_method))
         out_class = tpl_class.render(**copy_plas)
         return out_class
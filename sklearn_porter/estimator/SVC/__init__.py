@@ -1,6 +1,4 @@
 import warnings
-from copy import deepcopy
-from json import dumps, encoder
 from typing import Tuple, Union, Callable
 
 from loguru import logger as L
@@ -27,27 +25,27 @@ class SVC(EstimatorBase, EstimatorApiABC):
 
     SUPPORT = {
         enum.Language.C: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.GO: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.JAVA: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.JS: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.PHP: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
         enum.Language.RUBY: {
-            enum.Template.ATTACHED: {enum.Method.PREDICT},
-            enum.Template.EXPORTED: {enum.Method.PREDICT},
+            enum.Template.ATTACHED: frozenset({enum.Method.PREDICT}),
+            enum.Template.EXPORTED: frozenset({enum.Method.PREDICT}),
         },
     }
 
@@ -102,8 +100,8 @@ class SVC(EstimatorBase, EstimatorApiABC):
             coef0=params['coef0'],
             degree=params['degree'],
         )
-        L.info('Model data (keys): {}'.format(self.model_data.keys()))
-        L.opt(lazy=True).debug('Model data: {}'.format(self.model_data))
+        L.info('Model data (keys): {}', self.model_data.keys())
+        L.opt(lazy=True).debug('Model data: {}', lambda: self.model_data)
 
         self.meta_info = dict(
             n_classes=len(est.classes_),
@@ -113,8 +111,8 @@ class SVC(EstimatorBase, EstimatorApiABC):
             n_coeffs=len(self.model_data.get('coeffs')),
             n_inters=len(self.model_data.get('inters')),
         )
-        L.info('Meta info (keys): {}'.format(self.meta_info.keys()))
-        L.opt(lazy=True).debug('Meta info: {}'.format(self.meta_info))
+        L.info('Meta info (keys): {}', self.meta_info.keys())
+        L.opt(lazy=True).debug('Meta info: {}', lambda: self.meta_info)
 
     def port(
         self,
@@ -148,7 +146,7 @@ class SVC(EstimatorBase, EstimatorApiABC):
         The ported estimator.
         """
         # Placeholders:
-        plas = deepcopy(self.placeholders)  # alias
+        plas = dict(self.placeholders)  # alias
         plas.update(dict(
             class_name=class_name,
             to_json=to_json,
@@ -162,8 +160,7 @@ class SVC(EstimatorBase, EstimatorApiABC):
         if template == enum.Template.EXPORTED:
             tpl_class = tpls.get_template('exported.class')
             out_class = tpl_class.render(**plas)
-            encoder.FLOAT_REPR = lambda o: converter(o)
-            model_data = dumps(self.model_data, separators=(',', ':'))
+            model_data = self._dumps(self.model_data, converter)
             return out_class, model_data
 
         # Make 'attached' variant:
@@ -193,7 +190,7 @@ class SVC(EstimatorBase, EstimatorApiABC):
             values=', '.join(
                 list(
                     tpl_in_brackets.render(
-                        value=', '.join(list(map(converter, v)))
+                        value=', '.join(map(converter, v))
                     ) for v in vectors_val
                 )
             ),
@@ -209,7 +206,7 @@ class SVC(EstimatorBase, EstimatorApiABC):
             values=', '.join(
                 list(
                     tpl_in_brackets.render(
-                        value=', '.join(list(map(converter, v)))
+                        value=', '.join(map(converter, v))
                     ) for v in coeffs_val
                 )
             ),
@@ -222,7 +219,7 @@ class SVC(EstimatorBase, EstimatorApiABC):
         inters_str = tpl_arr_1.render(
             type=tpl_double,
             name='inters',
-            values=', '.join(list(map(converter, inters_val))),
+            values=', '.join(map(converter, inters_val)),
             n=len(self.model_data.get('inters'))
         )
 
@@ -1,3 +1,19 @@
 from logging import ERROR
 
 options = {'logging.level': ERROR}
+
+
+def default_converter(value: object) -> str:
+    """
+    The default converter of all floating numbers.
+
+    Parameters
+    ----------
+    value : object
+        The number to convert.
+
+    Returns
+    -------
+    The string representation of the number.
+    """
+    return str(value)
@@ -1,7 +1,12 @@
+import json
+import logging
 import os
 import random as rd
 import shutil
+import urllib.request
 import warnings
+from importlib import import_module
+from io import BytesIO, StringIO
 from os import environ
 from pathlib import Path
 from sys import version_info
@@ -10,6 +15,7 @@ from typing import Callable, Tuple
 import numpy as np
 import pytest
 from joblib import dump
+from loguru import logger
 
 # scikit-learn
 from sklearn import preprocessing
@@ -27,9 +33,13 @@ from sklearn.tree.tree import DecisionTreeClassifier
 from sklearn_porter import exceptions as exception
 from sklearn_porter.cli.__main__ import parse_args
 from sklearn_porter.Estimator import Estimator, can, show
+from sklearn_porter.Estimator import (
+    _configure_logging, _get_gson, _get_support, _system_call
+)
 from sklearn_porter.cli.command.port import main as port_main
 from sklearn_porter.cli.command.save import main as save_main
 from sklearn_porter.cli.command.show import main as show_main
+from sklearn_porter.utils import options
 
 from tests.commons import (
     SKLEARN_VERSION, CANDIDATES, CLASSIFIERS, DATASETS, Candidate, Dataset,
@@ -137,6 +147,14 @@ def test_show_output():
     assert 'JavaScript' not in table
 
 
+def test_can_with_classes():
+    """Test the support of classes with different metaclasses."""
+    assert can(LinearSVC, language='java')
+    assert can(LinearSVC, language='java', template='attached')
+    assert can(DecisionTreeClassifier, language='java')
+    assert not can(LinearSVC, language='c', template='exported')
+
+
 def test_optional_kwargs(fitted_tree):
     est = Estimator(
         fitted_tree,
@@ -147,6 +165,74 @@ def test_optional_kwargs(fitted_tree):
     assert est.converter(0.11111) == '0.111'
 
 
+def test_default_converter_keeps_the_sign_of_zero(fitted_tree):
+    est = Estimator(fitted_tree)
+    assert est.converter(0.0) == '0.0'
+    assert est.converter(-0.0) == '-0.0'
+    assert est.converter(0.0) == '0.0'
+
+
+def test_converter_on_exported_model_data(fitted_tree):
+    est = Estimator(
+        fitted_tree,
+        language='java',
+        template='exported',
+        converter=lambda x: '{:.1f}'.format(x)
+    )
+    _, model_data = est.port()
+    thresholds = json.loads(model_data).get('thresholds')
+    expected = [round(t, 1) for t in fitted_tree.tree_.threshold.tolist()]
+    assert thresholds == expected
+
+
+def test_converter_on_embedded_model_data():
+    dataset = load_iris()
+    x, y = dataset.data, dataset.target
+    clf = AdaBoostClassifier(n_estimators=3, random_state=0)
+    clf.fit(X=x, y=y)
+    est = Estimator(
+        clf,
+        language='js',
+        template='attached',
+        converter=lambda x: '{:.1f}'.format(x)
+    )
+    _, model_data = est.port()
+    for tree in json.loads(model_data):
+        thresholds = tree.get('thresholds')
+        assert thresholds == [round(t, 1) for t in thresholds]
+
+
+@pytest.fixture
+def logging_output(monkeypatch) -> StringIO:
+    """Fixture to capture the output of the configured logger."""
+    module = import_module('sklearn_porter.Estimator')
+    output = StringIO()
+    monkeypatch.setattr(module, 'stdout', output)
+    monkeypatch.setattr(module, '_LOGGING_HANDLER', None)
+    monkeypatch.setattr(module, '_LOGGING_LEVEL', None)
+    yield output
+
+    # Restore a handler with the configured level:
+    monkeypatch.undo()
+    logger.remove()
+    module._LOGGING_HANDLER = None
+    _configure_logging(options.get('logging.level'))
+
+
+def test_logging_level_changes_after_removed_handlers(logging_output):
+    _configure_logging(logging.DEBUG)
+    logger.remove()  # e.g. removed by the user
+    _configure_logging(logging.INFO)
+    logger.debug('Hidden message.')
+    logger.info('Visible message.')
+    _configure_logging(logging.DEBUG)
+    logger.debug('Debug message.')
+    output = logging_output.getvalue()
+    assert 'Hidden message.' not in output
+    assert 'Visible message.' in output
+    assert 'Debug message.' in output
+
+
 def test_common_properties(fitted_tree):
     est = Estimator(fitted_tree)
     assert isinstance(est.template, str)
@@ -167,6 +253,69 @@ def test_and_compare_multiprocessed_results(fitted_tree):
     assert res_a[0][2] == res_b[0][2]
 
 
+def test_system_call_with_retries(tmp_path: Path):
+    marker = tmp_path / 'marker'
+    flaky = (
+        'test -f {0} || (touch {0}; exit 1); '
+        'echo \'{{"predict": 2, "predict_proba": [0.2, 0.8]}}\''
+    ).format(marker)
+    assert _system_call(flaky) == [2, [0.2, 0.8]]
+
+    # The failing command is part of the error:
+    with pytest.raises(RuntimeError, match='exit 3'):
+        _system_call('exit 3')
+
+
+@pytest.fixture
+def gson_download(tmp_path: Path, monkeypatch):
+    """Fixture to mock the download of the Gson library."""
+    responses = []  # e.g. bytes or exceptions per download attempt
+    requests = []
+
+    def urlopen(url):
+        requests.append(url)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return BytesIO(response)
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setattr(urllib.request, 'urlopen', urlopen)
+    monkeypatch.setattr(
+        import_module('sklearn_porter.Estimator'), 'sleep', lambda s: None
+    )
+    return responses, requests, tmp_path / 'sklearn-porter'
+
+
+def test_gson_download_is_cached(gson_download):
+    responses, requests, cache_dir = gson_download
+    responses.append(b'jar')
+    path_a = _get_gson('https://example.com/gson.jar')
+    path_b = _get_gson('https://example.com/gson.jar')
+    assert path_a == path_b == cache_dir / 'gson.jar'
+    assert path_a.read_bytes() == b'jar'
+    assert len(requests) == 1
+    assert [p.name for p in cache_dir.iterdir()] == ['gson.jar']
+
+
+def test_gson_download_with_retries(gson_download):
+    responses, requests, cache_dir = gson_download
+    responses.extend([OSError('timeout'), b'', b'jar'])
+    path = _get_gson('https://example.com/gson.jar')
+    assert path.read_bytes() == b'jar'
+    assert len(requests) == 3
+    assert [p.name for p in cache_dir.iterdir()] == ['gson.jar']
+
+
+def test_gson_download_with_failures(gson_download):
+    responses, requests, cache_dir = gson_download
+    responses.extend([OSError('timeout')] * 3)
+    with pytest.raises(OSError):
+        _get_gson('https://example.com/gson.jar')
+    assert len(requests) == 3
+    assert list(cache_dir.iterdir()) == []
+
+
 def test_file_handling(fitted_tree, tmp_root_dir):
     dataset = load_iris()
     x, y = dataset.data, dataset.target
@@ -240,6 +389,38 @@ def test_list_of_classifiers():
         assert classifiers == result
 
 
+def test_order_of_classifiers():
+    """Test the order of the classifiers."""
+    names = [c.__name__ for c in Estimator.classifiers()]
+    assert names[:10] == [
+        'AdaBoostClassifier',
+        'BernoulliNB',
+        'DecisionTreeClassifier',
+        'ExtraTreesClassifier',
+        'GaussianNB',
+        'KNeighborsClassifier',
+        'LinearSVC',
+        'NuSVC',
+        'RandomForestClassifier',
+        'SVC',
+    ]
+    assert names[10:] in ([], ['MLPClassifier'])
+
+
+def _get_default_language(clazz: type) -> str:
+    """Get the first supported language of an estimator class."""
+    return next(iter(_get_support(clazz.__name__))).value.KEY
+
+
+def test_can_with_installed_estimators():
+    """Test the support of installed and unknown estimators."""
+    for clazz in Estimator.classifiers() + Estimator.regressors():
+        assert can(clazz)
+        assert can(clazz, language=_get_default_language(clazz))
+    assert not can(SGDClassifier)
+    assert not can('LinearSVC')
+
+
 @pytest.mark.parametrize('candidate', CANDIDATES, ids=lambda x: x.name)
 def test_unfitted_estimator(candidate: Candidate):
     """Test unfitted estimators."""
@@ -0,0 +1,70 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# sklearn-porter
+from sklearn_porter.estimator import EstimatorBase as estimator_base
+from sklearn_porter.estimator.EstimatorBase import EstimatorBase, _write_text
+from sklearn_porter.utils import default_converter
+
+
+@pytest.mark.parametrize(
+    'converter', [str, default_converter, lambda x: '{:.2f}'.format(x)],
+    ids=['str', 'default', 'custom']
+)
+def test_dumps_with_non_finite_numbers(converter):
+    data = dict(w=np.array([1.0, np.nan, np.inf, -np.inf]))
+    out = EstimatorBase._dumps(data, converter)
+    assert 'NaN' in out
+    assert 'Infinity' in out
+    assert '-Infinity' in out
+    w = json.loads(out).get('w')
+    assert w[0] == 1.0
+    assert np.isnan(w[1])
+    assert w[2] == float('inf')
+    assert w[3] == float('-inf')
+
+
+def test_dumps_with_default_converter():
+    data = dict(a=np.array([[0.1, -0.0], [1e16, 2]]), b=[1, 'x', None])
+    out = EstimatorBase._dumps(data, default_converter)
+    expected = json.dumps(
+        dict(a=[[0.1, -0.0], [1e16, 2.0]], b=[1, 'x', None]),
+        separators=(',', ':')
+    )
+    assert out == expected
+    assert out == EstimatorBase._dumps(data, lambda x: str(x))
+
+
+def test_write_text(tmp_path: Path):
+    path = tmp_path / 'Estimator.java'
+    _write_text(path, 'class A {}')
+    _write_text(path, 'class B {}')
+    assert path.read_text() == 'class B {}'
+    assert [p.name for p in tmp_path.iterdir()] == ['Estimator.java']
+
+
+def test_write_text_concurrently(tmp_path: Path):
+    path = tmp_path / 'Estimator.java'
+    texts = ['class A{} {{}}'.format(i) for i in range(20)]
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda text: _write_text(path, text), texts))
+    assert path.read_text() in texts
+    assert [p.name for p in tmp_path.iterdir()] == ['Estimator.java']
+
+
+def test_write_text_with_failure(tmp_path: Path, monkeypatch):
+    path = tmp_path / 'Estimator.java'
+    _write_text(path, 'class A {}')
+
+    def fsync(fd):
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(estimator_base, 'fsync', fsync)
+    with pytest.raises(OSError):
+        _write_text(path, 'class B {}')
+    assert path.read_text() == 'class A {}'
+    assert [p.name for p in tmp_path.iterdir()] == ['Estimator.java']
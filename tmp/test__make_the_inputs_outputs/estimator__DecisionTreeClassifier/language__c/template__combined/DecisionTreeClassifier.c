@@ -0,0 +1,128 @@
+/*
+This file is generated by https://github.com/nok/sklearn-porter/
+
+Estimator:
+    DecisionTreeClassifier
+    https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeClassifier.html
+
+Environment:
+    scikit-learn v0.22.1
+    sklearn-porter v1.0.0
+
+Usage:
+    1. Compile the generated source code:
+        $ gcc DecisionTreeClassifier.c -std=c99 -lm -o DecisionTreeClassifier
+    2. Execute a prediction:
+        $ ./DecisionTreeClassifier feature_1 ... feature_4
+*/
+#include <stdlib.h>
+#include <stdio.h>
+#include <math.h>
+
+#define N_FEATURES 4
+#define N_CLASSES 3
+
+
+int find_max(int nums[N_CLASSES]) {
+    int i;  int idx = 0;
+    for (i = 0; i < N_CLASSES; i++) {
+        idx = nums[i] > nums[idx] ? i : idx;
+    }
+    return idx;
+}
+
+void norm_vals(double *result, int nums[N_CLASSES]) {
+    int i;  double sum = 0.;
+    for (i = 0; i < N_CLASSES; i++) {
+        sum += nums[i];
+    }
+    if(sum == 0) {
+        for (i = 0; i < N_CLASSES; i++) {
+            result[i] = 1. / N_CLASSES;
+        }
+    } else {
+        for (i = 0; i < N_CLASSES; i++) {
+            result[i] = nums[i] / sum;
+        }
+    }
+}
+
+void compute(int *classes, double features[N_FEATURES]) {
+        
+    if (features[3] <= 0.800000011920929) {
+        classes[0] = 50; 
+    } else {
+        if (features[3] <= 1.75) {
+            if (features[2] <= 4.950000047683716) {
+                if (features[3] <= 1.6500000357627869) {
+                    classes[1] = 47; 
+                } else {
+                    classes[2] = 1; 
+                }
+            } else {
+                if (features[3] <= 1.550000011920929) {
+                    classes[2] = 3; 
+                } else {
+                    if (features[2] <= 5.450000047683716) {
+                        classes[1] = 2; 
+                    } else {
+                        classes[2] = 1; 
+                    }
+                }
+            }
+        } else {
+            if (features[2] <= 4.8500001430511475) {
+                if (features[1] <= 3.100000023841858) {
+                    classes[2] = 2; 
+                } else {
+                    classes[1] = 1; 
+                }
+            } else {
+                classes[2] = 43; 
+            }
+        }
+    }
+}
+
+int predict(double features[N_FEATURES]) {
+    int i;
+    int classes[N_CLASSES];
+    for (i = 0; i < N_CLASSES; i++) {
+        classes[i] = 0;
+    }
+    compute(classes, features);
+    return find_max(classes);
+}
+
+void predict_proba(double *result, double features[N_FEATURES]) {
+    int i;
+    int classes[N_CLASSES];
+    for (i = 0; i < N_CLASSES; i++) {
+        classes[i] = 0;
+    }
+    compute(classes, features);
+    norm_vals(result, classes);
+}
+
+int main(int argc, const char *argv[]) {
+
+    /* Features: */
+    double features[argc-1];
+    for (int i = 1; i < argc; i++) {
+        features[i-1] = atof(argv[i]);
+    }
+
+    /* Get JSON: */
+    double probabilities[N_CLASSES];
+    predict_proba(probabilities, features);
+    printf("{\"predict\": %d, \"predict_proba\": [", predict(features));
+    for (int i = 0; i < N_CLASSES; i++) {
+        printf("%.6f", probabilities[i]);
+        if (i < (N_CLASSES - 1)) {
+            printf(",");
+        }
+    }
+    printf("]}");
+
+    return 0;
+}
@@ -0,0 +1,124 @@
+/*
+This file is generated by https://github.com/nok/sklearn-porter/
+
+Estimator:
+    DecisionTreeClassifier
+    https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeClassifier.html
+
+Environment:
+    scikit-learn v0.22.1
+    sklearn-porter v1.0.0
+
+Usage:
+    1. Compile the generated source code:
+        $ go build DecisionTreeClassifier.go
+    2. Execute a prediction:
+        $ ./DecisionTreeClassifier feature_1 ... feature_4
+*/
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"strconv"
+)
+type response struct {
+	Predict int `json:"predict"`
+	PredictProba []float64 `json:"predict_proba"`
+}
+
+type DecisionTreeClassifier struct {
+	Lefts []int
+	Rights []int
+	Thresholds []float64
+	Indices []int
+	Classes [][]int
+}
+
+func findMax(nums []int) int {
+	var idx = 0
+	for i := 0; i < len(nums); i++ {
+		if nums[i] > nums[idx] {
+			idx = i
+		}
+	}
+	return idx
+}
+
+func normVals(nums []int) []float64 {
+	var l = len(nums)
+	var sum = 0
+	for i := 0; i < l; i++ {
+		sum += nums[i]
+	}
+	result := make([]float64, l)
+	if sum == 0 {
+		for i := 0; i < l; i++ {
+			result[i] = float64(1) / float64(l)
+		}
+	} else {
+		for i := 0; i < l; i++ {
+			result[i] = float64(nums[i]) / float64(sum)
+		}
+	}
+	return result
+}
+
+func (dtc DecisionTreeClassifier) predict(features []float64, node int) int {
+	if dtc.Thresholds[node] != -2 {
+		if features[dtc.Indices[node]] <= dtc.Thresholds[node] {
+			return dtc.predict(features, dtc.Lefts[node])
+		} else {
+			return dtc.predict(features, dtc.Rights[node])
+		}
+	}
+	return findMax(dtc.Classes[node])
+}
+
+func (dtc DecisionTreeClassifier) Predict(features []float64) int {
+	return dtc.predict(features, 0)
+}
+
+func (dtc DecisionTreeClassifier) predictProba(features []float64, node int) []float64 {
+	if dtc.Thresholds[node] != -2 {
+		if features[dtc.Indices[node]] <= dtc.Thresholds[node] {
+			return dtc.predictProba(features, dtc.Lefts[node])
+		} else {
+			return dtc.predictProba(features, dtc.Rights[node])
+		}
+	}
+	return normVals(dtc.Classes[node])
+}
+
+func (dtc DecisionTreeClassifier) PredictProba(features []float64) []float64 {
+	return dtc.predictProba(features, 0)
+}
+
+func main() {
+
+	// Features:
+	var features []float64
+	for _, arg := range os.Args[1:] {
+		if n, err := strconv.ParseFloat(arg, 64); err == nil {
+			features = append(features, n)
+		}
+	}
+
+	// Model data:
+	lefts := []int {1, -1, 3, 4, 5, -1, -1, 8, -1, 10, -1, -1, 13, 14, -1, -1, -1}
+	rights := []int {2, -1, 12, 7, 6, -1, -1, 9, -1, 11, -1, -1, 16, 15, -1, -1, -1}
+	thresholds := []float64 {0.800000011920929, -2.0, 1.75, 4.950000047683716, 1.6500000357627869, -2.0, -2.0, 1.550000011920929, -2.0, 5.450000047683716, -2.0, -2.0, 4.8500001430511475, 3.100000023841858, -2.0, -2.0, -2.0}
+	indices := []int {3, -2, 3, 2, 3, -2, -2, 3, -2, 2, -2, -2, 2, 1, -2, -2, -2}
+	classes := [][]int {{50, 50, 50}, {50, 0, 0}, {0, 50, 50}, {0, 49, 5}, {0, 47, 1}, {0, 47, 0}, {0, 0, 1}, {0, 2, 4}, {0, 0, 3}, {0, 2, 1}, {0, 2, 0}, {0, 0, 1}, {0, 1, 45}, {0, 1, 2}, {0, 0, 2}, {0, 1, 0}, {0, 0, 43}}
+
+	// Estimator:
+	clf := DecisionTreeClassifier{lefts, rights, thresholds, indices, classes}
+
+	// Get JSON:
+	prediction := clf.Predict(features)
+	probabilities := clf.PredictProba(features)
+	res, _ := json.Marshal(&response{Predict: prediction, PredictProba: probabilities})
+	fmt.Println(string(res))
+
+}
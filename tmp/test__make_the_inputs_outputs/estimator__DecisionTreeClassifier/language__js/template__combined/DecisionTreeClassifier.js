@@ -0,0 +1,123 @@
+/*
+This file is generated by https://github.com/nok/sklearn-porter/
+
+Estimator:
+    DecisionTreeClassifier
+    https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeClassifier.html
+
+Environment:
+    scikit-learn v0.22.1
+    sklearn-porter v1.0.0
+
+Usage:
+    1. Execute a prediction:
+        $ node DecisionTreeClassifier.js feature_1 ... feature_4
+*/
+var DecisionTreeClassifier = function() {
+
+    var _findMax = function(nums) {
+        var i = 0, l = nums.length, idx = 0;
+        for (; i < l; i++) {
+            idx = nums[i] > nums[idx] ? i : idx;
+        }
+        return idx;
+    };
+
+    var _normVals = function(nums) {
+        var i, l = nums.length,
+            result = [],
+            sum = 0.;
+        for (i = 0; i < l; i++) {
+            sum += nums[i];
+        }
+        if(sum === 0) {
+            for (i = 0; i < l; i++) {
+                result[i] = 1.0 / l;
+            }
+        } else {
+            for (i = 0; i < l; i++) {
+                result[i] = nums[i] / sum;
+            }
+        }
+        return result;
+    };
+
+    this._compute = function(features, post) {
+        var classes = new Array(3).fill(0);
+            
+        if (features[3] <= 0.800000011920929) {
+            classes[0] = 50; 
+        } else {
+            if (features[3] <= 1.75) {
+                if (features[2] <= 4.950000047683716) {
+                    if (features[3] <= 1.6500000357627869) {
+                        classes[1] = 47; 
+                    } else {
+                        classes[2] = 1; 
+                    }
+                } else {
+                    if (features[3] <= 1.550000011920929) {
+                        classes[2] = 3; 
+                    } else {
+                        if (features[2] <= 5.450000047683716) {
+                            classes[1] = 2; 
+                        } else {
+                            classes[2] = 1; 
+                        }
+                    }
+                }
+            } else {
+                if (features[2] <= 4.8500001430511475) {
+                    if (features[1] <= 3.100000023841858) {
+                        classes[2] = 2; 
+                    } else {
+                        classes[1] = 1; 
+                    }
+                } else {
+                    classes[2] = 43; 
+                }
+            }
+        }
+        return post(classes);
+    };
+
+    this.predict = function(features) {
+        return this._compute(features, _findMax);
+    };
+
+    this.predictProba = function(features) {
+        return this._compute(features, _normVals);
+    };
+
+};
+
+var main = function () {
+    if (typeof process !== 'undefined' && typeof process.argv !== 'undefined') {
+        if (process.argv.length - 2 !== 4) {
+            var IllegalArgumentException = function(message) {
+                this.message = message;
+                this.name = "IllegalArgumentException";
+            }
+            throw new IllegalArgumentException("You have to pass 4 features.");
+        }
+    }
+
+    // Features:
+    var features = process.argv.slice(2);
+    for (var i = 0; i < features.length; i++) {
+        features[i] = parseFloat(features[i]);
+    }
+
+    // Estimator:
+    var clf = new DecisionTreeClassifier();
+
+    // Get JSON:
+    console.log(JSON.stringify({
+        "predict": clf.predict(features),
+        "predict_proba": clf.predictProba(features)
+    }));
+}
+
+if (require.main === module) {
+    main();
+}
@@ -0,0 +1,97 @@
+# This file is generated by https://github.com/nok/sklearn-porter/
+#
+# Estimator:
+#     DecisionTreeClassifier
+#     https://scikit-learn.org/stable/modules/generated/sklearn.tree.DecisionTreeClassifier.html
+#
+# Environment:
+#     scikit-learn v0.22.1
+#     sklearn-porter v1.0.0
+#
+# Usage:
+#     1. Execute a prediction:
+#         $ ruby DecisionTreeClassifier.rb feature_1 ... feature_4
+require 'json'
+
+
+class DecisionTreeClassifier
+
+	def initialize (lefts, rights, thresholds, indices, classes)
+		@lefts = lefts
+		@rights = rights
+		@thresholds = thresholds
+		@indices = indices
+		@classes = classes
+	end
+
+	def _find_max (nums)
+		idx = 0
+		for i in 0 ... nums.length
+			idx = nums[i] > nums[idx] ? i : idx
+		end
+		idx
+	end
+
+	def _norm_vals (nums)
+		result = []
+		sum = 0
+		for i in 0 ... nums.length
+			sum += nums[i]
+		end
+		if sum == 0
+			l = nums.length
+			for i in 0 ... l
+				result[i] = 1.0 / l
+			end
+		else
+			for i in 0 ... nums.length
+				result[i] = nums[i] / sum
+			end
+		end
+		result
+	end
+
+	def _compute (features, node, post)
+		if @thresholds[node] != -2
+			if features[@indices[node]] <= @thresholds[node]
+				return _compute features, @lefts[node], post
+			else
+				return _compute features, @rights[node], post
+			end
+		end
+		post.call @classes[node]
+	end
+
+	def predict (features)
+		_compute features, 0, post=method(:_find_max)
+	end
+
+	def predict_proba (features)
+		_compute features, 0, post=method(:_norm_vals)
+	end
+
+end
+
+if __FILE__ == $0
+	if ARGV.length != 4
+		raise "You have to pass 4 features."
+	end
+
+	# Features:
+	features = ARGV.collect(&:to_f)
+
+	# Model data:
+	lefts = [1, -1, 3, 4, 5, -1, -1, 8, -1, 10, -1, -1, 13, 14, -1, -1, -1]
+	rights = [2, -1, 12, 7, 6, -1, -1, 9, -1, 11, -1, -1, 16, 15, -1, -1, -1]
+	thresholds = [0.800000011920929, -2.0, 1.75, 4.950000047683716, 1.6500000357627869, -2.0, -2.0, 1.550000011920929, -2.0, 5.450000047683716, -2.0, -2.0, 4.8500001430511475, 3.100000023841858, -2.0, -2.0, -2.0]
+	indices = [3, -2, 3, 2, 3, -2, -2, 3, -2, 2, -2, -2, 2, 1, -2, -2, -2]
+	classes = [[50, 50, 50], [50, 0, 0], [0, 50, 50], [0, 49, 5], [0, 47, 1], [0, 47, 0], [0, 0, 1], [0, 2, 4], [0, 0, 3], [0, 2, 1], [0, 2, 0], [0, 0, 1], [0, 1, 45], [0, 1, 2], [0, 0, 2], [0, 1, 0], [0, 0, 43]]
+
+	# Estimator:
+	clf = DecisionTreeClassifier.new lefts, rights, thresholds, indices, classes
+
+	# Get JSON:
+	prediction = clf.predict features
+	probabilities = clf.predict_proba features
+	puts JSON.generate({:predict => prediction, :predict_proba => probabilities})
+end